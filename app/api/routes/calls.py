@@ -73,10 +73,12 @@ async def create_call(
 @router.get("/calls", response_model=list[CallRead])
 async def list_calls(
     status: Optional[CallStatus] = Query(default=None),
+    limit: Optional[int] = Query(default=None, ge=1, le=500),
+    offset: int = Query(default=0, ge=0),
     session: Session = Depends(get_db_session),
 ) -> list[CallRead]:
     call_service = CallService(session)
-    calls = call_service.list_calls(status=status)
+    calls = call_service.list_calls(status=status, limit=limit, offset=offset)
     return [CallRead.model_validate(c) for c in calls]
 
 
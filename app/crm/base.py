@@ -1,8 +1,23 @@
+from dataclasses import dataclass
 from typing import Protocol, runtime_checkable, List
 
 from app.models.crm import CRMNote, CRMTask
 
 
+@dataclass
+class CRMUpsert:
+    call_id: int
+    note_content: str
+    action_items: List[str]
+
+
+@dataclass
+class CRMUpsertResult:
+    call_id: int
+    note: CRMNote
+    tasks: List[CRMTask]
+
+
 @runtime_checkable
 class CRMClient(Protocol):
     def create_note(self, call_id: int, content: str) -> CRMNote:
@@ -10,3 +25,6 @@ class CRMClient(Protocol):
 
     def create_tasks(self, call_id: int, action_items: List[str]) -> List[CRMTask]:
         ...
+
+    def batch_upsert(self, upserts: List[CRMUpsert]) -> List[CRMUpsertResult]:
+        ...
@@ -3,7 +3,7 @@ from typing import List
 
 from sqlmodel import Session
 
-from app.crm.base import CRMClient
+from app.crm.base import CRMClient, CRMUpsert, CRMUpsertResult
 from app.models.crm import CRMNote, CRMTask
 
 logger = logging.getLogger(__name__)
@@ -32,3 +32,20 @@ class FakeCRMClient(CRMClient):
             self.session.refresh(task)
         logger.info("Created %s fake CRM tasks for call %s", len(tasks), call_id)
         return tasks
+
+    def batch_upsert(self, upserts: List[CRMUpsert]) -> List[CRMUpsertResult]:
+        results: List[CRMUpsertResult] = []
+        for upsert in upserts:
+            note = CRMNote(call_id=upsert.call_id, content=upsert.note_content)
+            tasks = [CRMTask(call_id=upsert.call_id, description=item) for item in upsert.action_items]
+            self.session.add(note)
+            self.session.add_all(tasks)
+            results.append(CRMUpsertResult(call_id=upsert.call_id, note=note, tasks=tasks))
+        # One commit for the whole batch, like a single composite request to a real CRM
+        self.session.commit()
+        for result in results:
+            self.session.refresh(result.note)
+            for task in result.tasks:
+                self.session.refresh(task)
+        logger.info("Upserted fake CRM notes and tasks for %s calls", len(results))
+        return results
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import datetime
 from typing import Optional
@@ -74,3 +75,6 @@ class AnalysisService:
             self.session.rollback()
             logger.error("Failed to save analysis for call %s: %s", call_id, str(e))
             raise ValueError(f"Failed to save analysis: {str(e)}") from e
+
+    async def analyze_call_async(self, call_id: int) -> CallAnalysis:
+        return await asyncio.to_thread(self.analyze_call, call_id)
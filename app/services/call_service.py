@@ -1,8 +1,9 @@
 import logging
+from dataclasses import dataclass, fields
 from datetime import datetime
 from typing import List, Optional
 
-from sqlmodel import Session, select
+from sqlmodel import Session, func, select
 
 from app.core.constants import CallStatus
 from app.models import Call
@@ -11,6 +12,38 @@ from app.schemas import CallCreate
 logger = logging.getLogger(__name__)
 
 
+@dataclass
+class CallRow:
+    """Display-only projection of a Call used by the call list."""
+    id: int
+    title: str
+    status: CallStatus
+    recorded_at: datetime
+    call_type: Optional[str]
+    contact_name: Optional[str]
+    company: Optional[str]
+    crm_deal_id: Optional[str]
+
+
+# Columns read by the call list; full Call rows are only hydrated when mutated
+_CALL_ROW_COLUMNS = tuple(getattr(Call, f.name) for f in fields(CallRow))
+
+
+def _filter_calls(query, status: Optional[CallStatus] = None, search_query: str = "", session_id: Optional[str] = None):
+    if session_id:
+        query = query.where(Call.session_id == session_id)
+    if status:
+        query = query.where(Call.status == status)
+    if search_query:
+        search = f"%{search_query.lower()}%"
+        query = query.where(
+            (func.lower(Call.title).like(search)) |
+            (func.lower(Call.contact_name).like(search)) |
+            (func.lower(Call.company).like(search))
+        )
+    return query
+
+
 class CallService:
     def __init__(self, session: Session):
         self.session = session
@@ -30,13 +63,41 @@ class CallService:
         logger.info("Created call %s with audio %s", call.id, audio_path)
         return call
 
-    def list_calls(self, status: Optional[CallStatus] = None, session_id: Optional[str] = None) -> List[Call]:
-        query = select(Call)
-        if session_id:
-            query = query.where(Call.session_id == session_id)
-        if status:
-            query = query.where(Call.status == status)
-        return self.session.exec(query.order_by(Call.recorded_at.desc())).all()
+    def list_calls(
+        self,
+        status: Optional[CallStatus] = None,
+        session_id: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+    ) -> List[Call]:
+        query = _filter_calls(select(Call), status, session_id=session_id)
+        query = query.order_by(Call.recorded_at.desc(), Call.id.desc()).offset(offset)
+        if limit is not None:
+            query = query.limit(limit)
+        return self.session.exec(query).all()
+
+    def count_calls(
+        self,
+        status: Optional[CallStatus] = None,
+        search_query: str = "",
+        session_id: Optional[str] = None,
+    ) -> int:
+        query = _filter_calls(select(func.count(Call.id)), status, search_query, session_id)
+        return self.session.exec(query).one()
+
+    def list_call_rows(
+        self,
+        status: Optional[CallStatus] = None,
+        search_query: str = "",
+        session_id: Optional[str] = None,
+        limit: int = 10,
+        offset: int = 0,
+    ) -> List[CallRow]:
+        """Like list_calls, plus title/contact/company search, loading only the columns of CallRow."""
+        query = _filter_calls(select(*_CALL_ROW_COLUMNS), status, search_query, session_id)
+        # id breaks recorded_at ties so pages are stable and the latest upload comes first
+        query = query.order_by(Call.recorded_at.desc(), Call.id.desc()).offset(offset).limit(limit)
+        return [CallRow(*row) for row in self.session.exec(query).all()]
 
     def get_call(self, call_id: int) -> Optional[Call]:
         return self.session.get(Call, call_id)
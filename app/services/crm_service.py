@@ -1,11 +1,12 @@
+import asyncio
 import logging
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from sqlmodel import Session, select
 
 from app.core.constants import CallStatus, CRMSyncStatus
-from app.crm.base import CRMClient
+from app.crm.base import CRMClient, CRMUpsert
 from app.models import Call, CallAnalysis, CRMNote, CRMTask, CRMSyncLog
 
 logger = logging.getLogger(__name__)
@@ -33,68 +34,139 @@ class CRMService:
             raise ValueError("Analysis required before CRM sync")
 
         try:
-            parts = []
-            if analysis.summary:
-                parts.append(f"SUMMARY:\n{analysis.summary}")
-            if analysis.pain_points:
-                parts.append(f"PAIN POINTS:\n{analysis.pain_points}")
-            if analysis.objections:
-                parts.append(f"OBJECTIONS:\n{analysis.objections}")
-            
-            if getattr(analysis, "follow_up_sent", False):
-                sent_at = getattr(analysis, "follow_up_sent_at", datetime.utcnow())
-                date_str = sent_at.strftime("%Y/%m/%d")
-                parts.append(f"FOLLOW-UP:\nEmail sent to client on {date_str}.")
-            else:
-                parts.append("FOLLOW-UP:\nNot sent yet.")
-                
-            note_content = "\n\n".join(parts) or "No content available"
-            note = self.client.create_note(call_id=call_id, content=note_content)
-            # Deduplicate against existing tasks for this call (case-insensitive, trimmed)
+            note = self.client.create_note(call_id=call_id, content=_note_content(analysis))
             existing_tasks = self.session.exec(
                 select(CRMTask).where(CRMTask.call_id == call_id)
             ).all()
-            
-            # Normalize strings for comparison: lowercase, strip, remove extra spaces
-            def normalize(s: str) -> str:
-                return " ".join((s or "").split()).lower()
-
-            existing_descriptions = {
-                normalize(t.description) for t in existing_tasks
-            }
-            deduped_items: List[str] = []
             items_to_sync = selected_action_items if selected_action_items is not None else analysis.action_items
-            for item in items_to_sync:
-                normalized = normalize(item)
-                if normalized and normalized not in existing_descriptions:
-                    deduped_items.append(item)
-                    existing_descriptions.add(normalized)
-            tasks = self.client.create_tasks(call_id=call_id, action_items=deduped_items)
-
-            log = CRMSyncLog(
-                call_id=call_id,
-                status=CRMSyncStatus.SUCCESS,
-                message="Synced note and tasks",
-                created_at=datetime.utcnow(),
-                payload={"note_id": note.id, "task_ids": [t.id for t in tasks]},
+            tasks = self.client.create_tasks(
+                call_id=call_id, action_items=_new_action_items(items_to_sync, existing_tasks)
             )
-            call.status = CallStatus.COMPLETED if getattr(analysis, "follow_up_sent", False) else CallStatus.SYNCED
-            call.updated_at = datetime.utcnow()
-            self.session.add(log)
-            self.session.add(call)
+
+            log = self._mark_synced(call, analysis, note, tasks)
             self.session.commit()
             self.session.refresh(log)
             logger.info("CRM sync succeeded for call %s", call_id)
             return log
         except Exception as exc:  # pragma: no cover - defensive
-            log = CRMSyncLog(
-                call_id=call_id,
-                status=CRMSyncStatus.FAILURE,
-                message=str(exc),
-                created_at=datetime.utcnow(),
-            )
+            log = _failure_log(call_id, exc)
             self.session.add(log)
             self.session.commit()
             self.session.refresh(log)
             logger.error("CRM sync failed for call %s: %s", call_id, exc)
             raise
+
+    def sync_calls(self, call_ids: List[int]) -> List[CRMSyncLog]:
+        """Sync several analyzed calls with a single batch upsert to the CRM."""
+        call_ids = list(dict.fromkeys(call_ids))
+        calls = {
+            call.id: call for call in self.session.exec(select(Call).where(Call.id.in_(call_ids))).all()
+        }
+        analyses = {
+            analysis.call_id: analysis
+            for analysis in self.session.exec(
+                select(CallAnalysis).where(CallAnalysis.call_id.in_(call_ids))
+            ).all()
+        }
+        for call_id in call_ids:
+            if call_id not in calls:
+                raise ValueError(f"Call {call_id} not found")
+            if call_id not in analyses:
+                raise ValueError(f"Analysis required before CRM sync (call {call_id})")
+
+        existing_tasks: Dict[int, List[CRMTask]] = {call_id: [] for call_id in call_ids}
+        for task in self.session.exec(select(CRMTask).where(CRMTask.call_id.in_(call_ids))).all():
+            existing_tasks[task.call_id].append(task)
+
+        upserts = [
+            CRMUpsert(
+                call_id=call_id,
+                note_content=_note_content(analyses[call_id]),
+                action_items=_new_action_items(analyses[call_id].action_items, existing_tasks[call_id]),
+            )
+            for call_id in call_ids
+        ]
+        try:
+            results = self.client.batch_upsert(upserts)
+        except Exception as exc:  # pragma: no cover - defensive
+            # Drop notes/tasks the client staged before failing so only the failure logs are committed
+            self.session.rollback()
+            self.session.add_all(_failure_log(call_id, exc) for call_id in call_ids)
+            self.session.commit()
+            logger.error("CRM batch sync failed for calls %s: %s", call_ids, exc)
+            raise
+
+        logs = [
+            self._mark_synced(calls[result.call_id], analyses[result.call_id], result.note, result.tasks)
+            for result in results
+        ]
+        self.session.commit()
+        for log in logs:
+            self.session.refresh(log)
+        logger.info("CRM batch sync succeeded for %s calls", len(logs))
+        return logs
+
+    def _mark_synced(
+        self, call: Call, analysis: CallAnalysis, note: CRMNote, tasks: List[CRMTask]
+    ) -> CRMSyncLog:
+        """Stage the success log and status change for a synced call; the caller commits."""
+        log = CRMSyncLog(
+            call_id=call.id,
+            status=CRMSyncStatus.SUCCESS,
+            message="Synced note and tasks",
+            created_at=datetime.utcnow(),
+            payload={"note_id": note.id, "task_ids": [t.id for t in tasks]},
+        )
+        call.status = CallStatus.COMPLETED if getattr(analysis, "follow_up_sent", False) else CallStatus.SYNCED
+        call.updated_at = datetime.utcnow()
+        self.session.add(log)
+        self.session.add(call)
+        return log
+
+    async def sync_call_async(self, call_id: int, selected_action_items: Optional[List[str]] = None) -> CRMSyncLog:
+        return await asyncio.to_thread(self.sync_call, call_id, selected_action_items)
+
+
+def _note_content(analysis: CallAnalysis) -> str:
+    parts = []
+    if analysis.summary:
+        parts.append(f"SUMMARY:\n{analysis.summary}")
+    if analysis.pain_points:
+        parts.append(f"PAIN POINTS:\n{analysis.pain_points}")
+    if analysis.objections:
+        parts.append(f"OBJECTIONS:\n{analysis.objections}")
+
+    if getattr(analysis, "follow_up_sent", False):
+        sent_at = getattr(analysis, "follow_up_sent_at", datetime.utcnow())
+        date_str = sent_at.strftime("%Y/%m/%d")
+        parts.append(f"FOLLOW-UP:\nEmail sent to client on {date_str}.")
+    else:
+        parts.append("FOLLOW-UP:\nNot sent yet.")
+
+    return "\n\n".join(parts) or "No content available"
+
+
+def _new_action_items(items: List[str], existing_tasks: List[CRMTask]) -> List[str]:
+    """Drop items already present as tasks for the call (case-insensitive, trimmed) and repeats."""
+
+    # Normalize strings for comparison: lowercase, strip, remove extra spaces
+    def normalize(s: str) -> str:
+        return " ".join((s or "").split()).lower()
+
+    existing_descriptions = {normalize(t.description) for t in existing_tasks}
+    deduped_items: List[str] = []
+    for item in items:
+        normalized = normalize(item)
+        if normalized and normalized not in existing_descriptions:
+            deduped_items.append(item)
+            existing_descriptions.add(normalized)
+    return deduped_items
+
+
+def _failure_log(call_id: int, exc: Exception) -> CRMSyncLog:
+    return CRMSyncLog(
+        call_id=call_id,
+        status=CRMSyncStatus.FAILURE,
+        message=str(exc),
+        created_at=datetime.utcnow(),
+    )
@@ -1,3 +1,4 @@
+import asyncio
 import logging
 from datetime import datetime
 from typing import Optional
@@ -93,3 +94,6 @@ class TranscriptionService:
         self.session.refresh(transcript)
         logger.info("Completed transcription for call %s", call_id)
         return transcript
+
+    async def transcribe_call_async(self, call_id: int) -> Transcript:
+        return await asyncio.to_thread(self.transcribe_call, call_id)
@@ -1,19 +1,23 @@
-import io
+import functools
+import json
 import sys
-import time
 import uuid
 import urllib.parse
 import os
+from collections import defaultdict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Optional, List
+from typing import Optional, List, Tuple
 
 # Add project root to Python path
 project_root = Path(__file__).parent.parent.parent.parent
 sys.path.insert(0, str(project_root))
 
+import pandas as pd
 import streamlit as st
 from dotenv import load_dotenv
+from sqlalchemy import update
 from sqlmodel import Session, select, func
 
 # Load environment variables from .env file (local development)
@@ -34,7 +38,7 @@ from app.core.config import get_settings
 from app.core.constants import CallStatus, CRMSyncStatus
 from app.db.session import engine, reset_db, create_db_and_tables
 from app.models import Call, Transcript, CallAnalysis, CRMNote, CRMTask, CRMSyncLog
-from app.services.call_service import CallService
+from app.services.call_service import CallRow, CallService
 from app.services.transcription_service import TranscriptionService
 from app.services.analysis_service import AnalysisService
 from app.services.crm_service import CRMService
@@ -45,33 +49,149 @@ from app.schemas import CallCreate
 
 settings = get_settings()
 
+# Dashboard and metrics-grid styles, injected as a single markdown element per run
+_CSS = """
+<style>
+.main-header {
+    font-size: 2.5rem;
+    font-weight: 700;
+    color: #1f77b4;
+    margin-bottom: 0.5rem;
+}
+.metric-card {
+    background-color: #f0f2f6;
+    padding: 1rem;
+    border-radius: 0.5rem;
+    border-left: 4px solid #1f77b4;
+}
+.status-badge {
+    display: inline-block;
+    padding: 0.25rem 0.75rem;
+    border-radius: 1rem;
+    font-size: 0.875rem;
+    font-weight: 600;
+}
+.call-card {
+    background-color: white;
+    padding: 1.5rem;
+    border-radius: 0.5rem;
+    box-shadow: 0 2px 4px rgba(0,0,0,0.1);
+    margin-bottom: 1rem;
+}
+.stButton>button {
+    width: 100%;
+    border-radius: 0.5rem;
+    height: auto;
+    min-height: 44px; /* Better touch target for mobile */
+}
+
+/* Mobile optimizations */
+@media (max-width: 768px) {
+    .main-header {
+        font-size: 1.8rem;
+    }
+    .call-card {
+        padding: 1rem;
+    }
+    .block-container {
+        padding-top: 2rem;
+        padding-left: 1rem;
+        padding-right: 1rem;
+    }
+}
+
+.metric-container {
+    display: grid;
+    grid-template-columns: repeat(4, 1fr);
+    gap: 1rem;
+    margin-bottom: 2rem;
+}
+.metric-item {
+    background-color: #f0f2f6;
+    padding: 1rem;
+    border-radius: 0.5rem;
+    border-left: 4px solid #1f77b4;
+    box-shadow: 0 1px 2px rgba(0,0,0,0.05);
+}
+.metric-label {
+    color: #555;
+    font-size: 0.875rem;
+    margin-bottom: 0.25rem;
+    font-weight: 500;
+}
+.metric-value {
+    color: #0f172a;
+    font-size: 1.75rem;
+    font-weight: 700;
+}
+
+/* Mobile styles */
+@media (max-width: 768px) {
+    .metric-container {
+        grid-template-columns: repeat(2, 1fr);
+        gap: 0.75rem;
+    }
+    .metric-item {
+        padding: 0.75rem;
+    }
+    .metric-value {
+        font-size: 1.5rem;
+    }
+}
+</style>
+"""
+
 
 def get_session() -> Session:
     return Session(engine)
 
 
-def load_calls(session: Session, status_filter: Optional[CallStatus] = None, search_query: str = "", limit: int = 10, offset: int = 0, session_id: Optional[str] = None) -> tuple[List[Call], int]:
-    query = select(Call)
-    if session_id:
-        query = query.where(Call.session_id == session_id)
-    if status_filter:
-        query = query.where(Call.status == status_filter)
-    if search_query:
-        search = f"%{search_query.lower()}%"
-        query = query.where(
-            (func.lower(Call.title).like(search)) |
-            (func.lower(Call.contact_name).like(search)) |
-            (func.lower(Call.company).like(search))
-        )
-    
-    # Get total count for pagination
-    count_query = select(func.count()).select_from(query.subquery())
-    total_count = session.exec(count_query).one()
-    
-    # Get paginated results
-    calls = session.exec(query.order_by(Call.recorded_at.desc()).offset(offset).limit(limit)).all()
-    
-    return calls, total_count
+@st.cache_data(ttl=30, show_spinner=False)
+def fetch_page(page_number: int, page_size: int, status_filter: Optional[CallStatus] = None, search_query: str = "", session_id: Optional[str] = None) -> Tuple[List[CallRow], int, int]:
+    """Return (calls, total_count, page_number) for a filtered page; call invalidate_calls() after writes"""
+    with get_session() as session:
+        call_service = CallService(session)
+        total_count = call_service.count_calls(status_filter, search_query, session_id)
+        # Clamp the page before querying so a narrowed filter never needs a second pass
+        total_pages = max(1, (total_count + page_size - 1) // page_size)
+        page_number = min(page_number, total_pages)
+        offset = (page_number - 1) * page_size
+        calls = call_service.list_call_rows(status_filter, search_query, session_id, limit=page_size, offset=offset)
+    return calls, total_count, page_number
+
+
+def invalidate_calls() -> None:
+    fetch_page.clear()
+    calculate_metrics.clear()
+
+
+def _group_by_call(rows) -> dict:
+    grouped = defaultdict(list)
+    for row in rows:
+        grouped[row.call_id].append(row)
+    return grouped
+
+
+def fetch_call_details(session: Session, call_ids: List[int]) -> dict:
+    """Load transcripts, analyses and CRM records for a page of calls with one IN query per table"""
+    if not call_ids:
+        return {"transcripts": {}, "analyses": {}, "notes": {}, "tasks": {}, "logs": {}}
+
+    def first_per_call(model) -> dict:
+        rows = session.exec(select(model).where(model.call_id.in_(call_ids)).order_by(model.id)).all()
+        return {call_id: items[0] for call_id, items in _group_by_call(rows).items()}
+
+    def newest_first(model) -> dict:
+        rows = session.exec(select(model).where(model.call_id.in_(call_ids)).order_by(model.created_at.desc())).all()
+        return _group_by_call(rows)
+
+    return {
+        "transcripts": first_per_call(Transcript),
+        "analyses": first_per_call(CallAnalysis),
+        "notes": newest_first(CRMNote),
+        "tasks": newest_first(CRMTask),
+        "logs": newest_first(CRMSyncLog),
+    }
 
 
 def get_status_color(status: CallStatus) -> str:
@@ -85,50 +205,335 @@ def get_status_color(status: CallStatus) -> str:
     return colors.get(status, "⚪")
 
 
-def format_datetime(dt: datetime) -> str:
+LOG_PAGE_SIZE = 10
+
+# Anything other than a success (e.g. a failed sync) is flagged red
+_LOG_ICON = {CRMSyncStatus.SUCCESS: "🟢"}
+
+_MINUTE = 60
+_HOUR = 3600
+_DAY = 86400
+_WEEK = 604800
+
+
+def format_datetime(dt: datetime, now: Optional[datetime] = None) -> str:
     """Format datetime in a user-friendly way"""
-    now = datetime.utcnow()
-    diff = now - dt
-    
-    if diff < timedelta(minutes=1):
+    secs = ((now or datetime.utcnow()) - dt).total_seconds()
+
+    if secs < _MINUTE:
         return "Just now"
-    elif diff < timedelta(hours=1):
-        minutes = int(diff.total_seconds() / 60)
-        return f"{minutes}m ago"
-    elif diff < timedelta(days=1):
-        hours = int(diff.total_seconds() / 3600)
-        return f"{hours}h ago"
-    elif diff < timedelta(days=7):
-        days = diff.days
-        return f"{days}d ago"
-    else:
-        return dt.strftime("%b %d, %Y")
+    if secs < _HOUR:
+        return f"{int(secs // _MINUTE)}m ago"
+    if secs < _DAY:
+        return f"{int(secs // _HOUR)}h ago"
+    if secs < _WEEK:
+        return f"{int(secs // _DAY)}d ago"
+    return format_date(dt)
 
 
-def calculate_metrics(session: Session) -> dict:
-    """Calculate dashboard metrics"""
-    total_calls = session.exec(select(func.count(Call.id))).one()
-    new_calls = session.exec(select(func.count(Call.id)).where(Call.status == CallStatus.NEW)).one()
-    transcribed_calls = session.exec(select(func.count(Call.id)).where(Call.status == CallStatus.TRANSCRIBED)).one()
-    analyzed_calls = session.exec(select(func.count(Call.id)).where(Call.status == CallStatus.ANALYZED)).one()
-    synced_calls = session.exec(select(func.count(Call.id)).where(Call.status == CallStatus.SYNCED)).one()
-    completed_calls = session.exec(select(func.count(Call.id)).where(Call.status == CallStatus.COMPLETED)).one()
-    
-    # Recent calls (last 7 days)
-    week_ago = datetime.utcnow() - timedelta(days=7)
-    recent_calls = session.exec(
-        select(func.count(Call.id)).where(Call.recorded_at >= week_ago)
-    ).one()
-    
-    return {
-        "total": total_calls,
-        "new": new_calls,
-        "transcribed": transcribed_calls,
-        "analyzed": analyzed_calls,
-        "synced": synced_calls,
-        "completed": completed_calls,
-        "recent": recent_calls,
-    }
+# Relative labels depend on the per-run "now"; only the absolute strings are stable across reruns
+@functools.lru_cache(maxsize=4096)
+def format_date(dt: datetime) -> str:
+    return dt.strftime("%b %d, %Y")
+
+
+@functools.lru_cache(maxsize=4096)
+def format_timestamp(dt: datetime) -> str:
+    return dt.strftime("%Y-%m-%d %H:%M:%S UTC")
+
+
+@st.cache_data(max_entries=256, show_spinner=False)
+def build_mailto_link(title: str, body: str) -> str:
+    """Build a percent-encoded mailto link, memoized on the unchanged draft text"""
+    subject = urllib.parse.quote(f"Follow-up: {title}")
+    return f"mailto:?subject={subject}&body={urllib.parse.quote(body)}"
+
+
+@st.cache_resource
+def crm_executor() -> ThreadPoolExecutor:
+    """Worker pool shared across sessions for CRM calls that shouldn't block a rerun"""
+    return ThreadPoolExecutor(max_workers=4, thread_name_prefix="crm")
+
+
+def log_follow_up_sent(call_id: int) -> None:
+    # Runs on a worker thread, so it cannot share the script's session
+    with get_session() as session:
+        CRMService(session, _create_crm_client(session)).log_follow_up_sent(call_id)
+
+
+def show_crm_log_results() -> None:
+    """Toast each background CRM log that has finished, once"""
+    pending = st.session_state["crm_log_futures"]
+    for call_id, future in list(pending.items()):
+        if not future.done():
+            continue
+        del pending[call_id]
+        error = future.exception()
+        if error:
+            st.toast(f"Failed to log to CRM: {error}", icon="🚨")
+        else:
+            st.toast("Logged to CRM!", icon="✅")
+
+
+@st.fragment(run_every=1)
+def watch_crm_logs() -> None:
+    """Poll the background CRM logs and rerun the app once one finishes
+
+    The full rerun toasts the result and redraws the call's notes; when nothing
+    is left pending this fragment is no longer rendered, so the polling stops.
+    """
+    if any(future.done() for future in st.session_state["crm_log_futures"].values()):
+        st.rerun()
+
+
+@st.cache_data(ttl=30, show_spinner=False)
+def calculate_metrics() -> dict:
+    """Calculate dashboard metrics; cached and cleared together with fetch_page so both agree"""
+    with get_session() as session:
+        total_calls = session.exec(select(func.count(Call.id))).one()
+        new_calls = session.exec(select(func.count(Call.id)).where(Call.status == CallStatus.NEW)).one()
+        transcribed_calls = session.exec(select(func.count(Call.id)).where(Call.status == CallStatus.TRANSCRIBED)).one()
+        analyzed_calls = session.exec(select(func.count(Call.id)).where(Call.status == CallStatus.ANALYZED)).one()
+        synced_calls = session.exec(select(func.count(Call.id)).where(Call.status == CallStatus.SYNCED)).one()
+        completed_calls = session.exec(select(func.count(Call.id)).where(Call.status == CallStatus.COMPLETED)).one()
+
+        # Recent calls (last 7 days)
+        week_ago = datetime.utcnow() - timedelta(days=7)
+        recent_calls = session.exec(
+            select(func.count(Call.id)).where(Call.recorded_at >= week_ago)
+        ).one()
+
+        return {
+            "total": total_calls,
+            "new": new_calls,
+            "transcribed": transcribed_calls,
+            "analyzed": analyzed_calls,
+            "synced": synced_calls,
+            "completed": completed_calls,
+            "recent": recent_calls,
+        }
+
+
+@st.fragment
+def render_call_details(call: CallRow, details: dict, session: Session) -> None:
+    """Render the detail tabs of one call; edits inside rerun only this fragment"""
+    # Fragment reruns skip main(), so take the reference time here rather than reuse the full run's
+    now = datetime.utcnow()
+    # Details batch-loaded by the full run are used once; fragment reruns reload just this call
+    preloaded = st.session_state["preloaded_details"]
+    if call.id not in preloaded:
+        details = fetch_call_details(session, [call.id])
+    preloaded.discard(call.id)
+
+    transcript = details["transcripts"].get(call.id)
+    analysis = details["analyses"].get(call.id)
+    notes = details["notes"].get(call.id, [])
+    tasks = details["tasks"].get(call.id, [])
+    logs = details["logs"].get(call.id, [])
+    selected_key = f"selected_action_items_{call.id}"
+    selected_action_items = st.session_state[selected_key]
+
+    if transcript or analysis or notes or tasks:
+        tab1, tab2, tab3, tab4, tab5 = st.tabs(["📝 Transcript", "📊 Analysis", "📌 CRM Notes", "✅ Tasks", "📋 Sync Logs"])
+
+        with tab1:
+            if transcript and transcript.text:
+                st.markdown("### Full Transcript")
+                st.text_area("Transcript", transcript.text, height=300, key=f"transcript-{call.id}", disabled=True, label_visibility="hidden")
+            else:
+                st.info("No transcript available. Click 'Transcribe' to generate one.")
+
+        with tab2:
+            if analysis:
+                col_a, col_b = st.columns(2)
+
+                with col_a:
+                    st.markdown("### 📄 Summary")
+                    if analysis.summary:
+                        st.write(analysis.summary)
+                    else:
+                        st.info("No summary available")
+
+                    if analysis.pain_points:
+                        st.markdown("### 💔 Pain Points")
+                        st.write(analysis.pain_points)
+
+                    if analysis.objections:
+                        st.markdown("### ⚠️ Objections")
+                        st.write(analysis.objections)
+
+                with col_b:
+                    st.markdown("### ✅ Action Items")
+                    if analysis.action_items:
+                        st.caption("Select items to add them to your CRM Tasks list. They will be added after clicking 'Sync CRM'.")
+                        # Drop selections that no longer exist (e.g. after re-analysis)
+                        available_items = set(analysis.action_items)
+                        if not available_items.issuperset(selected_action_items):
+                            st.session_state[selected_key] = [
+                                ai for ai in selected_action_items if ai in available_items
+                            ]
+                        st.multiselect(
+                            "Action items to send to CRM",
+                            options=analysis.action_items,
+                            key=selected_key,
+                        )
+                    else:
+                        st.info("No pending action items")
+
+                    if analysis.follow_up_message:
+                        st.markdown("### 💬 Follow-up Draft")
+                        # Edits stay client-side until submit, so typing doesn't trigger reruns
+                        with st.form(f"followup-form-{call.id}", border=False):
+                            updated_message = st.text_area(
+                                "Follow-up Message",
+                                analysis.follow_up_message,
+                                height=200,
+                                key=f"followup-{call.id}",
+                                label_visibility="hidden"
+                            )
+
+                            # Save Draft Button
+                            col_save, col_empty = st.columns([1, 4])
+                            with col_save:
+                                submitted = st.form_submit_button("💾 Save", type="primary")
+
+                        if submitted:
+                            # Only write when the draft actually changed
+                            if (updated_message or "").strip() != (analysis.follow_up_message or "").strip():
+                                analysis.follow_up_message = updated_message
+                                session.add(analysis)
+                                session.commit()
+                                st.toast("Draft saved", icon="✅")
+                            else:
+                                st.toast("Draft already saved", icon="✅")
+
+                        # Follow-up Actions
+                        st.markdown("---")
+                        st.markdown("#### Actions")
+                        st.info("To complete the call workflow, mark the follow-up email as sent below.")
+
+                        # Prepare mailto link
+                        mailto_link = build_mailto_link(call.title, analysis.follow_up_message or "")
+
+                        col_email, col_sent, col_spacer = st.columns([2, 2, 3])
+
+                        with col_email:
+                            st.link_button("📧 Open Email", mailto_link)
+
+                        with col_sent:
+                            if analysis.follow_up_sent:
+                                st.success(f"Sent {format_datetime(analysis.follow_up_sent_at, now)}")
+                            else:
+                                if st.button("Mark Sent", key=f"mark-sent-{call.id}"):
+                                    analysis.follow_up_sent = True
+                                    analysis.follow_up_sent_at = datetime.utcnow()
+
+                                    # The list only holds display columns; load the full row to update it
+                                    call_record = session.get(Call, call.id)
+                                    if call_record.status == CallStatus.SYNCED:
+                                        call_record.status = CallStatus.COMPLETED
+                                    elif call_record.status != CallStatus.ANALYZED and call_record.status != CallStatus.COMPLETED:
+                                        call_record.status = CallStatus.ANALYZED
+
+                                    session.add(analysis)
+                                    session.add(call_record)
+                                    session.commit()
+
+                                    # Log to the CRM off the script thread; the result is toasted when it lands
+                                    st.session_state["crm_log_futures"][call.id] = crm_executor().submit(
+                                        log_follow_up_sent, call.id
+                                    )
+
+                                    invalidate_calls()
+                                    st.rerun()
+            else:
+                st.info("No analysis available. Click 'Analyze' to generate one.")
+
+        with tab3:
+            if notes:
+                # One table for all notes instead of an expander per note
+                st.dataframe(
+                    pd.DataFrame(
+                        [{"Created": format_datetime(note.created_at, now), "Note": note.content} for note in notes]
+                    ),
+                    hide_index=True,
+                    use_container_width=True,
+                    column_config={"Note": st.column_config.TextColumn(width="large")},
+                )
+            else:
+                st.info("No CRM notes available.")
+
+        with tab4:
+            if tasks:
+                tasks_df = pd.DataFrame(
+                    [
+                        {
+                            "id": task.id,
+                            "Done": task.completed,
+                            "Task": task.description,
+                            "Due": task.due_date,
+                            "Synced": format_datetime(task.created_at, now),
+                        }
+                        for task in tasks
+                    ]
+                ).set_index("id")
+
+                # Collect toggles client-side and persist them in one UPDATE on save
+                with st.form(f"task-form-{call.id}", border=False):
+                    edited_tasks = st.data_editor(
+                        tasks_df,
+                        key=f"tasks-editor-{call.id}",
+                        hide_index=True,
+                        use_container_width=True,
+                        disabled=["Task", "Due", "Synced"],
+                        column_config={"Done": st.column_config.CheckboxColumn()},
+                    )
+                    save_tasks = st.form_submit_button("💾 Save Tasks")
+
+                if save_tasks:
+                    toggled = edited_tasks.loc[edited_tasks["Done"] != tasks_df["Done"], "Done"]
+                    task_changes = [{"id": int(task_id), "completed": bool(done)} for task_id, done in toggled.items()]
+                    if task_changes:
+                        session.exec(update(CRMTask), params=task_changes)
+                        session.commit()
+                        st.toast("Tasks saved", icon="✅")
+            else:
+                st.info("No CRM tasks available.")
+
+        with tab5:
+            if logs:
+                # Render the newest logs first and page in older ones on demand
+                log_limit_key = f"log_limit_{call.id}"
+                log_limit = st.session_state.get(log_limit_key, LOG_PAGE_SIZE)
+                visible_logs = logs[:log_limit]
+                labels = [
+                    f"{_LOG_ICON.get(log.status, '🔴')} {log.status.value} ({format_datetime(log.created_at, now)})"
+                    for log in visible_logs
+                ]
+                for log, label in zip(visible_logs, labels):
+                    with st.expander(label, expanded=log.status != CRMSyncStatus.SUCCESS):
+                        st.caption(f"Timestamp: {format_timestamp(log.created_at)}")
+
+                        if log.message:
+                            st.markdown("**Message:**")
+                            if log.status == CRMSyncStatus.SUCCESS:
+                                st.info(log.message)
+                            else:
+                                st.error(log.message)
+
+                        if log.payload:
+                            st.markdown("**Debug Payload:**")
+                            st.code(json.dumps(log.payload, indent=2, default=str), language="json")
+
+                if len(logs) > log_limit:
+                    st.button(
+                        f"Show more ({len(logs) - log_limit} older)",
+                        key=f"more-logs-{call.id}",
+                        on_click=st.session_state.__setitem__,
+                        args=(log_limit_key, log_limit + LOG_PAGE_SIZE),
+                    )
+            else:
+                st.info("No sync logs available.")
 
 
 def main() -> None:
@@ -142,62 +547,24 @@ def main() -> None:
     # Ensure database tables exist
     create_db_and_tables()
 
+    # Single reference time for all relative timestamps in this render
+    now = datetime.utcnow()
+
     # Initialize Session ID for isolation
     if "session_id" not in st.session_state:
         st.session_state.session_id = str(uuid.uuid4())
+        # A fresh page load should see calls created elsewhere (e.g. via the API) since the cache filled
+        invalidate_calls()
     
+    # Background CRM logs started by earlier reruns, keyed by call id
+    if "crm_log_futures" not in st.session_state:
+        st.session_state["crm_log_futures"] = {}
+    show_crm_log_results()
+    if st.session_state["crm_log_futures"]:
+        watch_crm_logs()
+
     # Custom CSS for better styling
-    st.markdown("""
-    <style>
-    .main-header {
-        font-size: 2.5rem;
-        font-weight: 700;
-        color: #1f77b4;
-        margin-bottom: 0.5rem;
-    }
-    .metric-card {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #1f77b4;
-    }
-    .status-badge {
-        display: inline-block;
-        padding: 0.25rem 0.75rem;
-        border-radius: 1rem;
-        font-size: 0.875rem;
-        font-weight: 600;
-    }
-    .call-card {
-        background-color: white;
-        padding: 1.5rem;
-        border-radius: 0.5rem;
-        box-shadow: 0 2px 4px rgba(0,0,0,0.1);
-        margin-bottom: 1rem;
-    }
-    .stButton>button {
-        width: 100%;
-        border-radius: 0.5rem;
-        height: auto;
-        min-height: 44px; /* Better touch target for mobile */
-    }
-    
-    /* Mobile optimizations */
-    @media (max-width: 768px) {
-        .main-header {
-            font-size: 1.8rem;
-        }
-        .call-card {
-            padding: 1rem;
-        }
-        .block-container {
-            padding-top: 2rem;
-            padding-left: 1rem;
-            padding-right: 1rem;
-        }
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    st.markdown(_CSS, unsafe_allow_html=True)
     
     st.markdown('<h1 class="main-header">📞 Prema Vision | Sales Call Summarizer</h1>', unsafe_allow_html=True)
     st.markdown("---")
@@ -237,6 +604,7 @@ def main() -> None:
                             audio_path=str(p),
                             session_id=st.session_state.session_id
                         )
+                        invalidate_calls()
                         st.rerun()
                     else:
                         st.error("Demo file 1 not found")
@@ -259,6 +627,7 @@ def main() -> None:
                             audio_path=str(p),
                             session_id=st.session_state.session_id
                         )
+                        invalidate_calls()
                         st.rerun()
                     else:
                         st.error("Demo file 2 not found")
@@ -291,7 +660,8 @@ def main() -> None:
                 try:
                     recorded_dt = datetime.combine(recorded_at, recorded_time)
                     filename = f"{datetime.utcnow().timestamp()}-{audio_file.name}"
-                    audio_path = save_audio_file(filename, io.BytesIO(audio_file.getvalue()))
+                    # UploadedFile is file-like; save_audio_file copies it to disk in chunks
+                    audio_path = save_audio_file(filename, audio_file)
                     call_payload = CallCreate(
                         title=title,
                         recorded_at=recorded_dt,
@@ -307,6 +677,7 @@ def main() -> None:
                         session_id=st.session_state.session_id if settings.demo_mode else None
                     )
                     st.success(f"Call created successfully! ID: {new_call.id}")
+                    invalidate_calls()
                     st.rerun()
                 except Exception as e:
                     st.error(f"Error creating call: {str(e)}")
@@ -320,7 +691,10 @@ def main() -> None:
             ["All"] + [status.value for status in CallStatus],
             key="status_filter"
         )
-        search_query = st.text_input("🔎 Search", placeholder="Search by title, contact, or company...")
+        # Apply the search on submit (button or Enter) instead of on every keystroke
+        with st.form("search_form", border=False):
+            search_query = st.text_input("🔎 Search", placeholder="Search by title, contact, or company...")
+            st.form_submit_button("Search", use_container_width=True)
 
         st.markdown("---")
         # Settings Popover
@@ -329,54 +703,11 @@ def main() -> None:
             if st.button("🧨 Reset Database", type="primary", use_container_width=True):
                 reset_db()
                 st.success("Database reset successfully!")
+                invalidate_calls()
                 st.rerun()
     
     # Metrics Dashboard
-    metrics = calculate_metrics(session)
-    
-    # Custom CSS for metrics grid
-    st.markdown("""
-    <style>
-    .metric-container {
-        display: grid;
-        grid-template-columns: repeat(4, 1fr);
-        gap: 1rem;
-        margin-bottom: 2rem;
-    }
-    .metric-item {
-        background-color: #f0f2f6;
-        padding: 1rem;
-        border-radius: 0.5rem;
-        border-left: 4px solid #1f77b4;
-        box-shadow: 0 1px 2px rgba(0,0,0,0.05);
-    }
-    .metric-label {
-        color: #555;
-        font-size: 0.875rem;
-        margin-bottom: 0.25rem;
-        font-weight: 500;
-    }
-    .metric-value {
-        color: #0f172a;
-        font-size: 1.75rem;
-        font-weight: 700;
-    }
-    
-    /* Mobile styles */
-    @media (max-width: 768px) {
-        .metric-container {
-            grid-template-columns: repeat(2, 1fr);
-            gap: 0.75rem;
-        }
-        .metric-item {
-            padding: 0.75rem;
-        }
-        .metric-value {
-            font-size: 1.5rem;
-        }
-    }
-    </style>
-    """, unsafe_allow_html=True)
+    metrics = calculate_metrics()
 
     st.markdown(f"""
     <div class="metric-container">
@@ -418,23 +749,18 @@ def main() -> None:
         st.session_state.page_number = 1
     
     PAGE_SIZE = 10
-    offset = (st.session_state.page_number - 1) * PAGE_SIZE
-    
+
     # Filter calls
     selected_status = None if status_filter == "All" else CallStatus(status_filter)
-    calls, total_count = load_calls(
-        session, 
-        status_filter=selected_status, 
-        search_query=search_query or "", 
-        limit=PAGE_SIZE, 
-        offset=offset,
-        session_id=st.session_state.session_id if settings.demo_mode else None
+    call_filters = dict(
+        status_filter=selected_status,
+        search_query=search_query or "",
+        session_id=st.session_state.session_id if settings.demo_mode else None,
     )
-    
-    # Reset to page 1 if search/filter changes result in no items on current page (basic check)
-    if total_count > 0 and offset >= total_count:
-        st.session_state.page_number = 1
-        st.rerun()
+    calls, total_count, st.session_state.page_number = fetch_page(
+        st.session_state.page_number, PAGE_SIZE, **call_filters
+    )
+    total_pages = max(1, (total_count + PAGE_SIZE - 1) // PAGE_SIZE)
 
     # Header with refresh button
     header_col1, header_col2 = st.columns([3, 1])
@@ -442,6 +768,7 @@ def main() -> None:
         st.subheader(f"📋 Calls ({total_count})")
     with header_col2:
         if st.button("🔄 Refresh", use_container_width=True):
+            invalidate_calls()
             st.rerun()
 
     # Initialize error state
@@ -454,8 +781,12 @@ def main() -> None:
         else:
             st.info("No calls match the current filters.")
     else:
+        details = fetch_call_details(session, [call.id for call in calls])
+        st.session_state["preloaded_details"] = {call.id for call in calls}
+
         # Display calls in a better format
-        for call in calls:
+        last_index = len(calls) - 1
+        for index, call in enumerate(calls):
             with st.container():
                 # Call header card
                 # Use fewer columns for the header on mobile/general layout
@@ -477,7 +808,7 @@ def main() -> None:
                 with h_col1:
                     status_emoji = get_status_color(call.status)
                     st.markdown(f"### {status_emoji} {call.title}")
-                    st.caption(f"Recorded: {format_datetime(call.recorded_at)} • {call.call_type or 'N/A'}")
+                    st.caption(f"Recorded: {format_datetime(call.recorded_at, now)} • {call.call_type or 'N/A'}")
                 with h_col2:
                     # Compact status
                     status_colors = {
@@ -516,7 +847,7 @@ def main() -> None:
                             transcription_service.transcribe_call(call.id)
                             st.toast("Transcribed successfully!", icon="✅")
                             st.session_state["call_errors"].pop(call.id, None)
-                            time.sleep(1)
+                            invalidate_calls()
                             st.rerun()
                         except Exception as e:
                             transcribe_container.button("🎙️ Transcribe", key=f"t-retry-{call.id}", use_container_width=True)
@@ -531,7 +862,7 @@ def main() -> None:
                             analysis_service.analyze_call(call.id)
                             st.toast("Analyzed successfully!", icon="✅")
                             st.session_state["call_errors"].pop(call.id, None)
-                            time.sleep(1)
+                            invalidate_calls()
                             st.rerun()
                         except Exception as e:
                             analyze_container.button("🧠 Analyze", key=f"a-retry-{call.id}", use_container_width=True)
@@ -548,193 +879,21 @@ def main() -> None:
                             crm_service.sync_call(call.id, selected_action_items=selected_action_items)
                             st.session_state["call_errors"].pop(call.id, None)
                             st.toast("Synced with CRM!", icon="✅")
-                            time.sleep(1)
+                            invalidate_calls()
                             st.rerun()
                         except Exception as e:
                             sync_container.button("🔄 Sync CRM", key=f"s-retry-{call.id}", use_container_width=True)
                             st.session_state["call_errors"][call.id] = f"CRM Sync failed: {str(e)}"
                             st.rerun()
                 
-                # Call details in tabs
-                transcript = session.exec(select(Transcript).where(Transcript.call_id == call.id)).first()
-                analysis = session.exec(select(CallAnalysis).where(CallAnalysis.call_id == call.id)).first()
-                notes = session.exec(select(CRMNote).where(CRMNote.call_id == call.id).order_by(CRMNote.created_at.desc())).all()
-                tasks = session.exec(select(CRMTask).where(CRMTask.call_id == call.id).order_by(CRMTask.created_at.desc())).all()
-                logs = session.exec(select(CRMSyncLog).where(CRMSyncLog.call_id == call.id).order_by(CRMSyncLog.created_at.desc())).all()
-                
-                if transcript or analysis or notes or tasks:
-                    tab1, tab2, tab3, tab4, tab5 = st.tabs(["📝 Transcript", "📊 Analysis", "📌 CRM Notes", "✅ Tasks", "📋 Sync Logs"])
-                    
-                    with tab1:
-                        if transcript and transcript.text:
-                            st.markdown("### Full Transcript")
-                            st.text_area("Transcript", transcript.text, height=300, key=f"transcript-{call.id}", disabled=True, label_visibility="hidden")
-                        else:
-                            st.info("No transcript available. Click 'Transcribe' to generate one.")
-                    
-                    with tab2:
-                        if analysis:
-                            col_a, col_b = st.columns(2)
-                            
-                            with col_a:
-                                st.markdown("### 📄 Summary")
-                                if analysis.summary:
-                                    st.write(analysis.summary)
-                                else:
-                                    st.info("No summary available")
-                                
-                                if analysis.pain_points:
-                                    st.markdown("### 💔 Pain Points")
-                                    st.write(analysis.pain_points)
-                                
-                                if analysis.objections:
-                                    st.markdown("### ⚠️ Objections")
-                                    st.write(analysis.objections)
-                            
-                            with col_b:
-                                st.markdown("### ✅ Action Items")
-                                if analysis.action_items:
-                                    st.caption("Check items to add them to your CRM Tasks list. They will be added after clicking 'Sync CRM'.")
-                                    for i, item in enumerate(list(analysis.action_items)):
-                                        is_checked = st.checkbox(
-                                            item,
-                                            value=item in selected_action_items,
-                                            key=f"action-{call.id}-{i}",
-                                        )
-                                        if is_checked and item not in selected_action_items:
-                                            selected_action_items.append(item)
-                                            st.session_state[selected_key] = selected_action_items
-                                        if not is_checked and item in selected_action_items:
-                                            selected_action_items = [ai for ai in selected_action_items if ai != item]
-                                            st.session_state[selected_key] = selected_action_items
-                                else:
-                                    st.info("No pending action items")
-                                
-                                if analysis.follow_up_message:
-                                    st.markdown("### 💬 Follow-up Draft")
-                                    updated_message = st.text_area(
-                                        "Follow-up Message", 
-                                        analysis.follow_up_message, 
-                                        height=200, 
-                                        key=f"followup-{call.id}",
-                                        label_visibility="hidden"
-                                    )
-                                    
-                                    # Save Draft Button
-                                    col_save, col_empty = st.columns([1, 4])
-                                    with col_save:
-                                        # Check if current text differs from DB
-                                        current_db_val = analysis.follow_up_message or ""
-                                        current_ui_val = updated_message or ""
-                                        is_dirty = current_ui_val.strip() != current_db_val.strip()
-                                        
-                                        if is_dirty:
-                                            # Show primary Save button if changes detected
-                                            if st.button("💾 Save", key=f"save-btn-{call.id}", type="primary"):
-                                                analysis.follow_up_message = updated_message
-                                                session.add(analysis)
-                                                session.commit()
-                                                st.rerun()
-                                        else:
-                                            # Show disabled/secondary Saved button if synced
-                                            st.button("✅ Saved", key=f"save-btn-{call.id}", disabled=True)
-                                    
-                                    # Follow-up Actions
-                                    st.markdown("---")
-                                    st.markdown("#### Actions")
-                                    st.info("To complete the call workflow, mark the follow-up email as sent below.")
-                                    
-                                    # Prepare mailto link
-                                    subject = urllib.parse.quote(f"Follow-up: {call.title}")
-                                    body = urllib.parse.quote(analysis.follow_up_message or "")
-                                    mailto_link = f"mailto:?subject={subject}&body={body}"
-                                    
-                                    col_email, col_sent, col_spacer = st.columns([2, 2, 3])
-                                    
-                                    with col_email:
-                                        st.link_button("📧 Open Email", mailto_link)
-                                        
-                                    with col_sent:
-                                        if analysis.follow_up_sent:
-                                            st.success(f"Sent {format_datetime(analysis.follow_up_sent_at)}")
-                                        else:
-                                            if st.button("Mark Sent", key=f"mark-sent-{call.id}"):
-                                                analysis.follow_up_sent = True
-                                                analysis.follow_up_sent_at = datetime.utcnow()
-                                                
-                                                if call.status == CallStatus.SYNCED:
-                                                    call.status = CallStatus.COMPLETED
-                                                elif call.status != CallStatus.ANALYZED and call.status != CallStatus.COMPLETED:
-                                                    call.status = CallStatus.ANALYZED
-                                                
-                                                session.add(analysis)
-                                                session.add(call)
-                                                session.commit()
-                                                
-                                                try:
-                                                    crm_service.log_follow_up_sent(call.id)
-                                                    st.toast("Logged to CRM!")
-                                                except Exception as e:
-                                                    st.error(f"Failed to log to CRM: {e}")
-                                                    
-                                                st.rerun()
-                        else:
-                            st.info("No analysis available. Click 'Analyze' to generate one.")
-                    
-                    with tab3:
-                        if notes:
-                            for note in notes:
-                                with st.expander(f"Note from {format_datetime(note.created_at)}"):
-                                    st.write(note.content)
-                        else:
-                            st.info("No CRM notes available.")
-                    
-                    with tab4:
-                        if tasks:
-                            for task in tasks:
-                                due_date_str = f" (Due: {task.due_date})" if task.due_date else ""
-                                synced_str = f" *[Synced: {format_datetime(task.created_at)}]*"
-                                new_completed = st.checkbox(
-                                    f"{task.description}{due_date_str}{synced_str}",
-                                    value=task.completed,
-                                    key=f"task-{task.id}"
-                                )
-                                if new_completed != task.completed:
-                                    task.completed = new_completed
-                                    session.add(task)
-                                    session.commit()
-                                    st.rerun()
-                        else:
-                            st.info("No CRM tasks available.")
-                    
-                    with tab5:
-                        if logs:
-                            for log in logs:
-                                status_icon = "🟢" if log.status == CRMSyncStatus.SUCCESS else "🔴"
-                                time_str = format_datetime(log.created_at)
-                                label = f"{status_icon} {log.status.value} ({time_str})"
-                                
-                                with st.expander(label, expanded=(log.status != CRMSyncStatus.SUCCESS)):
-                                    st.caption(f"Timestamp: {log.created_at.strftime('%Y-%m-%d %H:%M:%S UTC')}")
-                                    
-                                    if log.message:
-                                        st.markdown("**Message:**")
-                                        if log.status == CRMSyncStatus.SUCCESS:
-                                            st.info(log.message)
-                                        else:
-                                            st.error(log.message)
-                                    
-                                    if log.payload:
-                                        st.markdown("**Debug Payload:**")
-                                        st.json(log.payload)
-                        else:
-                            st.info("No sync logs available.")
+                render_call_details(call, details, session)
                 
-                st.markdown("---")
+                # Separators only go between cards
+                if index < last_index:
+                    st.markdown("---")
         
         # Pagination Controls
         if total_count > PAGE_SIZE:
-            total_pages = (total_count + PAGE_SIZE - 1) // PAGE_SIZE
             c1, c2, c3 = st.columns([1, 2, 1])
             with c1:
                 if st.session_state.page_number > 1:
@@ -1,17 +1,63 @@
+from datetime import datetime
+
 import pytest
+from sqlalchemy import event
+from sqlalchemy.pool import StaticPool
 from sqlmodel import create_engine, Session, SQLModel
 
+from app.asr.stub_client import StubTranscriptionClient
+from app.llm.stub_client import StubLLMClient
 from app.models import Call, Transcript, CallAnalysis, CRMNote, CRMTask, CRMSyncLog  # noqa: F401
+from app.schemas import CallCreate
+from app.services.call_service import CallService
+from app.services.transcription_service import TranscriptionService
 
 
-@pytest.fixture()
+@pytest.fixture(scope="session")
 def engine():
-    engine = create_engine("sqlite://", connect_args={"check_same_thread": False})
+    engine = create_engine("sqlite://", poolclass=StaticPool, connect_args={"check_same_thread": False})
+
+    # Let SQLAlchemy emit BEGIN itself so pysqlite honours the per-test SAVEPOINTs
+    @event.listens_for(engine, "connect")
+    def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+
+    @event.listens_for(engine, "begin")
+    def _emit_begin(conn):
+        conn.exec_driver_sql("BEGIN")
+
     SQLModel.metadata.create_all(engine)
-    return engine
+    yield engine
+    engine.dispose()
 
 
 @pytest.fixture()
 def session(engine):
-    with Session(engine) as session:
+    # Each test runs inside an outer transaction; service commits only release savepoints
+    connection = engine.connect()
+    transaction = connection.begin()
+    with Session(bind=connection, join_transaction_mode="create_savepoint") as session:
         yield session
+    transaction.rollback()
+    connection.close()
+
+
+# The stub clients are stateless, so one instance of each serves the whole session
+@pytest.fixture(scope="session")
+def transcription_client():
+    return StubTranscriptionClient()
+
+
+@pytest.fixture(scope="session")
+def llm_client():
+    return StubLLMClient()
+
+
+@pytest.fixture()
+def transcribed_call(session, transcription_client):
+    """A new call that has been through the stub transcription, with its transcript"""
+    call = CallService(session).create_call(
+        CallCreate(title="Call", recorded_at=datetime.utcnow()), audio_path="/tmp/audio.wav"
+    )
+    transcript = TranscriptionService(session, transcription_client).transcribe_call(call.id)
+    return call, transcript
@@ -2,28 +2,41 @@
 E2E Test Fixtures and Configuration
 
 This module provides fixtures for end-to-end testing including:
-- FastAPI test server instance
+- FastAPI app and in-process API client
 - Streamlit test server instance
 - Test database and file system setup
 - Browser instance management
 - Sample audio file generation
+- Call factory for API setup
 """
-import asyncio
-import multiprocessing
+import functools
 import os
 import shutil
 import subprocess
 import time
 from pathlib import Path
-from typing import Generator
+from typing import Awaitable, Callable, Generator
 
 import pytest
+from fastapi import FastAPI
 from playwright.async_api import Browser, BrowserContext, Page, async_playwright
-from sqlmodel import create_engine, SQLModel
-from httpx import AsyncClient
+from sqlmodel import create_engine, Session, SQLModel
+import httpx
+from httpx import ASGITransport, AsyncClient
 
 from app.models import Call, Transcript, CallAnalysis, CRMNote, CRMTask, CRMSyncLog  # noqa: F401
 
+from .test_helpers import build_wav_bytes, create_test_call, process_call_pipeline
+
+# Helpers match python_files but hold no tests; keep pytest from importing them as a test module.
+# Every shared fixture is defined here (one definition per name), never in helper modules.
+collect_ignore = ["test_helpers.py"]
+
+
+def _xdist_worker_index() -> int:
+    """Index of the pytest-xdist worker ("gw3" -> 3), or 0 when not running distributed"""
+    return int(os.environ.get("PYTEST_XDIST_WORKER", "gw0")[2:])
+
 
 @pytest.fixture(scope="session")
 def test_db_path(tmp_path_factory) -> str:
@@ -58,33 +71,13 @@ def test_env_vars(test_db_path: str, test_audio_dir: str) -> dict[str, str]:
     }
 
 
-@pytest.fixture(scope="session")
-def fastapi_server_port() -> int:
-    """Port for FastAPI test server"""
-    return 8888
-
-
 @pytest.fixture(scope="session")
 def streamlit_server_port() -> int:
     """Port for Streamlit test server"""
-    return 8889
-
-
-def _run_fastapi_server(port: int, env_vars: dict[str, str]) -> None:
-    """Run FastAPI server in a subprocess"""
-    # Set environment variables
-    env = os.environ.copy()
-    for key, value in env_vars.items():
-        env[key] = value
-    
-    # Import after setting env vars
-    import uvicorn
-    from app.main import app
-    
-    uvicorn.run(app, host="127.0.0.1", port=port, log_level="error", env_file=None)
+    return 8889 + _xdist_worker_index()
 
 
-def _run_streamlit_server(port: int, env_vars: dict[str, str]) -> None:
+def _run_streamlit_server(port: int, env_vars: dict[str, str]) -> subprocess.Popen:
     """Run Streamlit server in a subprocess"""
     # Set environment variables
     env = os.environ.copy()
@@ -102,66 +95,81 @@ def _run_streamlit_server(port: int, env_vars: dict[str, str]) -> None:
         "--server.port", str(port),
         "--server.headless", "true",
         "--server.runOnSave", "false",
+        "--server.fileWatcherType", "none",
         "--server.enableCORS", "false",
         "--server.enableXsrfProtection", "false",
         "--browser.gatherUsageStats", "false",
         "--logger.level", "error",
     ]
-    # Use subprocess.Popen but redirect output to devnull to avoid noise
-    with open(os.devnull, 'w') as devnull:
-        subprocess.Popen(
-            streamlit_cmd,
-            env=env,
-            stdout=devnull,
-            stderr=devnull,
-            cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-        )
+    # Launch directly from the test process, discarding output to avoid noise
+    return subprocess.Popen(
+        streamlit_cmd,
+        env=env,
+        stdout=subprocess.DEVNULL,
+        stderr=subprocess.DEVNULL,
+        cwd=os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+    )
+
+
+def _stop_process(process: subprocess.Popen, timeout: float) -> None:
+    """Terminate a server subprocess, killing it if it does not exit in time"""
+    if process.poll() is not None:
+        return
+    process.terminate()
+    try:
+        process.wait(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        process.kill()
+        process.wait()
 
 
 @pytest.fixture(scope="session")
-def fastapi_server(test_env_vars: dict[str, str], fastapi_server_port: int) -> Generator[str, None, None]:
-    """Start FastAPI server for testing"""
-    # Set environment variables before starting server
+def fastapi_app(test_env_vars: dict[str, str]) -> Generator[FastAPI, None, None]:
+    """Import the FastAPI app configured against the test database and audio dir"""
+    # Set environment variables before importing the app
     original_env = {}
     for key, value in test_env_vars.items():
         original_env[key] = os.environ.get(key)
         os.environ[key] = value
-    
-    process = multiprocessing.Process(
-        target=_run_fastapi_server,
-        args=(fastapi_server_port, test_env_vars),
-        daemon=True
-    )
-    process.start()
-    
-    # Wait for server to be ready
-    import requests
-    max_retries = 30
-    server_url = f"http://127.0.0.1:{fastapi_server_port}"
-    for i in range(max_retries):
-        try:
-            response = requests.get(f"{server_url}/health", timeout=1)
-            if response.status_code == 200:
-                break
-        except Exception:
-            pass
-        time.sleep(0.5)
-    else:
-        process.terminate()
-        process.join(timeout=2)
-        raise RuntimeError(f"FastAPI server failed to start on port {fastapi_server_port}")
-    
-    yield server_url
-    
-    # Cleanup
-    try:
-        process.terminate()
-        process.join(timeout=5)
-        if process.is_alive():
-            process.kill()
-    except Exception:
-        pass
-    
+
+    from app.core.config import get_settings
+    get_settings.cache_clear()
+    settings = get_settings()
+
+    from app.db import session as db_session
+    from app.storage import audio_storage
+
+    # app.db.session and app.storage.audio_storage bind their engine and settings on first
+    # import, which may have happened before the test env was set; point both at the test
+    # database and audio dir explicitly (before app.main creates tables) instead of relying
+    # on import order
+    engine = create_engine(test_env_vars["DATABASE_URL"])
+    module_patch = pytest.MonkeyPatch()
+    module_patch.setattr(db_session, "engine", engine)
+    module_patch.setattr(audio_storage, "settings", settings)
+
+    from app.main import app
+    from app.api.dependencies import get_db_session, get_llm_client, get_transcription_client
+    from app.asr.stub_client import StubTranscriptionClient
+    from app.llm.stub_client import StubLLMClient
+
+    def get_test_db_session() -> Generator[Session, None, None]:
+        with Session(engine) as session:
+            yield session
+
+    # Pin the deterministic stubs even if a local .env configures Whisper/OpenAI
+    transcription_client = StubTranscriptionClient()
+    llm_client = StubLLMClient()
+    app.dependency_overrides[get_db_session] = get_test_db_session
+    app.dependency_overrides[get_transcription_client] = lambda: transcription_client
+    app.dependency_overrides[get_llm_client] = lambda: llm_client
+
+    yield app
+
+    app.dependency_overrides.clear()
+    module_patch.undo()
+    engine.dispose()
+
     # Restore original environment
     for key, value in original_env.items():
         if value is None:
@@ -179,63 +187,39 @@ def streamlit_server(test_env_vars: dict[str, str], streamlit_server_port: int)
         original_env[key] = os.environ.get(key)
         os.environ[key] = value
     
-    process = multiprocessing.Process(
-        target=_run_streamlit_server,
-        args=(streamlit_server_port, test_env_vars),
-        daemon=True
-    )
-    process.start()
+    process = _run_streamlit_server(streamlit_server_port, test_env_vars)
     
     # Wait for server to be ready - Streamlit takes longer to start
-    import requests
-    max_retries = 60
     server_url = f"http://127.0.0.1:{streamlit_server_port}"
-    for i in range(max_retries):
-        try:
-            # Try multiple endpoints Streamlit might use
-            try:
-                response = requests.get(f"{server_url}/_stcore/health", timeout=2)
-                if response.status_code == 200:
-                    break
-            except Exception:
-                pass
-            
-            # Try main page
+    delay = 0.05
+    deadline = time.monotonic() + 60
+    # One kept-alive connection reused across polls, backing off until /_stcore/health answers
+    limits = httpx.Limits(max_keepalive_connections=2, max_connections=4)
+    with httpx.Client(base_url=server_url, timeout=1.0, limits=limits) as http:
+        last_error = "no response"
+        while time.monotonic() < deadline:
             try:
-                response = requests.get(server_url, timeout=2)
+                response = http.get("/_stcore/health")
                 if response.status_code == 200:
                     break
-            except Exception:
-                pass
-        except Exception:
-            pass
-        time.sleep(1)
-    else:
-        # Check if process is still running
-        if process.is_alive():
-            try:
-                process.terminate()
-                process.join(timeout=2)
-                if process.is_alive():
-                    process.kill()
-            except Exception:
-                pass
-        error_msg = (
-            f"Streamlit server failed to start on port {streamlit_server_port}. "
-            f"This may be due to missing dependencies (streamlit) or port conflicts."
-        )
-        raise RuntimeError(error_msg)
+                last_error = f"HTTP {response.status_code}"
+            except httpx.HTTPError as e:
+                last_error = type(e).__name__
+            time.sleep(delay)
+            delay = min(delay * 1.5, 1.0)
+        else:
+            _stop_process(process, timeout=2)
+            error_msg = (
+                f"Streamlit server failed to start on port {streamlit_server_port}: "
+                f"/_stcore/health never returned 200 (last: {last_error}). "
+                f"This may be due to missing dependencies (streamlit) or port conflicts."
+            )
+            raise RuntimeError(error_msg)
     
     yield server_url
     
     # Cleanup
-    try:
-        process.terminate()
-        process.join(timeout=10)
-        if process.is_alive():
-            process.kill()
-    except Exception:
-        pass
+    _stop_process(process, timeout=10)
     
     # Restore original environment
     for key, value in original_env.items():
@@ -245,14 +229,6 @@ def streamlit_server(test_env_vars: dict[str, str], streamlit_server_port: int)
             os.environ[key] = value
 
 
-@pytest.fixture(scope="session")
-def event_loop():
-    """Create an event loop for async tests"""
-    loop = asyncio.new_event_loop()
-    yield loop
-    loop.close()
-
-
 @pytest.fixture(scope="session")
 async def browser() -> Generator[Browser, None, None]:
     """Create a browser instance for Playwright tests"""
@@ -262,9 +238,9 @@ async def browser() -> Generator[Browser, None, None]:
         await browser.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 async def browser_context(browser: Browser) -> Generator[BrowserContext, None, None]:
-    """Create a browser context for each test"""
+    """Create a browser context shared by the tests of a module"""
     context = await browser.new_context(
         viewport={"width": 1920, "height": 1080},
         ignore_https_errors=True,
@@ -273,58 +249,101 @@ async def browser_context(browser: Browser) -> Generator[BrowserContext, None, N
     await context.close()
 
 
+def _banned_wait_for_timeout(timeout: float) -> None:
+    raise AssertionError(
+        "page.wait_for_timeout() is banned in e2e tests; wait on an expect() assertion instead"
+    )
+
+
 @pytest.fixture
 async def page(browser_context: BrowserContext) -> Generator[Page, None, None]:
-    """Create a new page for each test"""
+    """Create a new page for each test (hard sleeps are disabled on it)"""
     page = await browser_context.new_page()
+    page.wait_for_timeout = _banned_wait_for_timeout
     yield page
     await page.close()
+    # The context is shared, so don't let cookies leak into the next test
+    await browser_context.clear_cookies()
 
 
-@pytest.fixture
-async def api_client(fastapi_server: str) -> Generator[AsyncClient, None, None]:
-    """Create an HTTP client for API testing"""
-    async with AsyncClient(base_url=fastapi_server, timeout=30.0) as client:
+@pytest.fixture(scope="session")
+async def api_client(fastapi_app: FastAPI) -> Generator[AsyncClient, None, None]:
+    """HTTP client for API testing, dispatching in-process to the ASGI app (one per session)"""
+    async with AsyncClient(
+        transport=ASGITransport(app=fastapi_app, raise_app_exceptions=True),
+        base_url="http://test",
+        timeout=30.0,
+    ) as client:
         yield client
 
 
-@pytest.fixture
-def sample_audio_file(tmp_path):
-    """Create a sample audio file for testing (valid WAV file)"""
-    audio_file = tmp_path / "sample.wav"
-    
-    # Create a minimal valid WAV file
-    sample_rate = 44100
-    num_channels = 1
-    bits_per_sample = 16
-    duration_samples = int(sample_rate * 1.0)  # 1 second of audio
-    data_size = duration_samples * num_channels * (bits_per_sample // 8)
-    file_size = 36 + data_size  # Header (36 bytes) + data
-    
-    # WAV file structure
-    wav_data = bytearray()
-    # RIFF header
-    wav_data.extend(b"RIFF")
-    wav_data.extend((file_size - 8).to_bytes(4, "little"))  # Chunk size
-    wav_data.extend(b"WAVE")
-    # Format chunk
-    wav_data.extend(b"fmt ")
-    wav_data.extend((16).to_bytes(4, "little"))  # Format chunk size
-    wav_data.extend((1).to_bytes(2, "little"))   # Audio format (PCM)
-    wav_data.extend((num_channels).to_bytes(2, "little"))
-    wav_data.extend((sample_rate).to_bytes(4, "little"))
-    wav_data.extend((sample_rate * num_channels * (bits_per_sample // 8)).to_bytes(4, "little"))  # Byte rate
-    wav_data.extend((num_channels * (bits_per_sample // 8)).to_bytes(2, "little"))  # Block align
-    wav_data.extend((bits_per_sample).to_bytes(2, "little"))
-    # Data chunk
-    wav_data.extend(b"data")
-    wav_data.extend((data_size).to_bytes(4, "little"))
-    wav_data.extend(b"\x00" * data_size)  # Silent audio data
-    
-    audio_file.write_bytes(wav_data)
+@pytest.fixture(scope="session", autouse=True)
+async def _warm_up_api_client(api_client: AsyncClient) -> None:
+    """Send one /health request so lazy app setup (middleware stack, route
+    compilation) isn't billed to whichever test happens to run first on each worker"""
+    response = await api_client.get("/health")
+    response.raise_for_status()
+
+
+# The sample content is deterministic, so build it once per test session
+_WAV_BYTES = build_wav_bytes()
+
+
+@pytest.fixture(scope="session")
+def sample_audio_file(tmp_path_factory) -> Path:
+    """Sample audio file for testing (valid WAV), written once per session; treat it as read-only"""
+    audio_file = tmp_path_factory.mktemp("sample_audio") / "sample.wav"
+    audio_file.write_bytes(_WAV_BYTES)
     return audio_file
 
 
+@pytest.fixture(scope="session")
+def sample_audio_bytes() -> bytes:
+    """Sample WAV content for multipart uploads, so tests don't reopen the file per request"""
+    return _WAV_BYTES
+
+
+@pytest.fixture(scope="session")
+def create_call(api_client: AsyncClient, sample_audio_bytes: bytes) -> Callable[..., Awaitable[dict]]:
+    """Factory that uploads a call through the API and returns its JSON
+
+    Wraps create_test_call with the session's client and sample audio; pass form
+    fields as keyword arguments (``await create_call(title=...)``).
+    """
+    return functools.partial(create_test_call, api_client, sample_audio_bytes)
+
+
+async def _call_through(api_client: AsyncClient, create_call, title: str, *stages: str) -> int:
+    """Create a call and run the given pipeline stages on it, returning its id"""
+    call = await create_call(title=title)
+    await process_call_pipeline(api_client, call["id"], stages=stages)
+    return call["id"]
+
+
+@pytest.fixture(scope="session")
+async def transcribed_call_id(api_client: AsyncClient, create_call) -> int:
+    """Id of one call left in TRANSCRIBED, shared by tests that only read it"""
+    return await _call_through(api_client, create_call, "Transcribed Stage Call", "transcribe")
+
+
+@pytest.fixture(scope="session")
+async def analyzed_call_id(api_client: AsyncClient, create_call) -> int:
+    """Id of one call left in ANALYZED, shared by tests that only read it"""
+    return await _call_through(api_client, create_call, "Analyzed Stage Call", "transcribe", "analyze")
+
+
+@pytest.fixture(scope="session")
+async def fully_processed_call_id(api_client: AsyncClient, create_call) -> int:
+    """Id of one call taken through transcribe, analyze and CRM sync, shared by read-only tests
+
+    Tests that change the call further must only add to it (e.g. another sync),
+    never assume the exact counts left by other tests.
+    """
+    call = await create_call(title="Fully Processed Call", crm_deal_id="DEAL-789")
+    await process_call_pipeline(api_client, call["id"])
+    return call["id"]
+
+
 @pytest.fixture(scope="session", autouse=True)
 def setup_test_environment(test_db_path: str, test_audio_dir: str) -> Generator[None, None, None]:
     """Set up test environment once per session"""
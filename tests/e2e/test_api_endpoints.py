@@ -12,13 +12,14 @@ This test suite covers all FastAPI endpoints with comprehensive scenarios:
 - Full pipeline processing
 - Error handling and edge cases
 """
+import asyncio
 import io
-from datetime import datetime
-from pathlib import Path
 
 import pytest
 from httpx import AsyncClient
 
+from .test_helpers import RECORDED_AT
+
 pytestmark = [pytest.mark.e2e, pytest.mark.api]
 
 
@@ -42,32 +43,22 @@ class TestCallCreation:
     """Tests for call creation endpoint"""
     
     @pytest.mark.asyncio
-    async def test_create_call_with_all_fields(self, api_client: AsyncClient, sample_audio_file: Path):
+    async def test_create_call_with_all_fields(self, create_call):
         """
         Test Case: Create Call with All Fields
         Description: Create a call with all optional fields populated
         Expected: Returns 201 Created with call data including all fields
         """
-        recorded_at = datetime.utcnow().isoformat()
-        
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Discovery Call - Acme Corp",
-                    "recorded_at": recorded_at,
-                    "participants": "Alex Smith, Taylor Johnson",
-                    "call_type": "discovery",
-                    "contact_name": "Alex Smith",
-                    "company": "Acme Corp",
-                    "crm_deal_id": "DEAL-123",
-                    "external_id": "EXT-456",
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-        
-        assert response.status_code in [200, 201]  # FastAPI may return 200 or 201
-        data = response.json()
+        data = await create_call(
+            title="Discovery Call - Acme Corp",
+            participants="Alex Smith, Taylor Johnson",
+            call_type="discovery",
+            contact_name="Alex Smith",
+            company="Acme Corp",
+            crm_deal_id="DEAL-123",
+            external_id="EXT-456",
+        )
+        
         assert data["title"] == "Discovery Call - Acme Corp"
         assert data["contact_name"] == "Alex Smith"
         assert data["company"] == "Acme Corp"
@@ -81,26 +72,14 @@ class TestCallCreation:
         assert data["status"].upper() == "NEW"
     
     @pytest.mark.asyncio
-    async def test_create_call_minimal_fields(self, api_client: AsyncClient, sample_audio_file: Path):
+    async def test_create_call_minimal_fields(self, create_call):
         """
         Test Case: Create Call with Minimal Required Fields
         Description: Create a call with only title, recorded_at, and audio_file
         Expected: Returns 201 Created with call data using default values
         """
-        recorded_at = datetime.utcnow().isoformat()
-        
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Minimal Call",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
+        data = await create_call(title="Minimal Call")
         
-        assert response.status_code in [200, 201]  # FastAPI may return 200 or 201
-        data = response.json()
         assert data["title"] == "Minimal Call"
         assert data["status"].upper() == "NEW"
         assert data["participants"] == []
@@ -115,57 +94,44 @@ class TestCallCreation:
         # Missing title
         response = await api_client.post(
             "/calls",
-            data={"recorded_at": datetime.utcnow().isoformat()},
+            data={"recorded_at": RECORDED_AT},
             files={"audio_file": ("test.wav", io.BytesIO(b"dummy"), "audio/wav")}
         )
         assert response.status_code == 422
     
     @pytest.mark.asyncio
-    async def test_create_call_invalid_datetime(self, api_client: AsyncClient, sample_audio_file: Path):
+    async def test_create_call_invalid_datetime(self, api_client: AsyncClient, sample_audio_bytes: bytes):
         """
         Test Case: Create Call with Invalid DateTime Format
         Description: Attempt to create a call with invalid ISO datetime format
         Expected: Returns 400 Bad Request with error message
         """
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Test Call",
-                    "recorded_at": "invalid-datetime",
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
+        response = await api_client.post(
+            "/calls",
+            data={
+                "title": "Test Call",
+                "recorded_at": "invalid-datetime",
+            },
+            files={"audio_file": ("sample.wav", sample_audio_bytes, "audio/wav")}
+        )
         
         assert response.status_code == 400
         detail = response.json()["detail"].lower()
         assert "iso datetime" in detail or "datetime" in detail
     
     @pytest.mark.asyncio
-    async def test_create_call_with_empty_participants(self, api_client: AsyncClient, sample_audio_file: Path):
+    async def test_create_call_with_empty_participants(self, create_call):
         """
         Test Case: Create Call with Empty Participants
         Description: Create a call with empty participants string
         Expected: Returns 201 Created with empty participants list
         """
-        recorded_at = datetime.utcnow().isoformat()
+        data = await create_call(title="Call Without Participants", participants="")
         
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Call Without Participants",
-                    "recorded_at": recorded_at,
-                    "participants": "",
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-        
-        assert response.status_code in [200, 201]  # FastAPI may return 200 or 201
-        data = response.json()
         assert data["participants"] == []
 
 
+@pytest.mark.xdist_group("listing")
 class TestCallListing:
     """Tests for call listing endpoint"""
     
@@ -183,28 +149,18 @@ class TestCallListing:
         # Note: Database is session-scoped, so may contain data from other tests
     
     @pytest.mark.asyncio
-    async def test_list_calls_with_multiple_calls(self, api_client: AsyncClient, sample_audio_file: Path):
+    async def test_list_calls_with_multiple_calls(self, api_client: AsyncClient, create_call):
         """
         Test Case: List Multiple Calls
         Description: Create multiple calls and verify they are all returned
         Expected: Returns 200 OK with all created calls
         """
-        recorded_at = datetime.utcnow().isoformat()
         call_ids = []
         
         # Create 3 calls
         for i in range(3):
-            with open(sample_audio_file, "rb") as f:
-                response = await api_client.post(
-                    "/calls",
-                    data={
-                        "title": f"Test Call {i+1}",
-                        "recorded_at": recorded_at,
-                    },
-                    files={"audio_file": ("sample.wav", f, "audio/wav")}
-                )
-                assert response.status_code in [200, 201]  # FastAPI may return 200 or 201
-                call_ids.append(response.json()["id"])
+            call = await create_call(title=f"Test Call {i+1}")
+            call_ids.append(call["id"])
         
         # List all calls
         response = await api_client.get("/calls")
@@ -215,25 +171,15 @@ class TestCallListing:
         assert all(cid in returned_ids for cid in call_ids)  # All our calls should be present
     
     @pytest.mark.asyncio
-    async def test_list_calls_filtered_by_status(self, api_client: AsyncClient, sample_audio_file: Path):
+    async def test_list_calls_filtered_by_status(self, api_client: AsyncClient, create_call):
         """
         Test Case: List Calls Filtered by Status
         Description: Create calls in different states and filter by status
         Expected: Returns only calls matching the specified status
         """
-        recorded_at = datetime.utcnow().isoformat()
-        
         # Create a call
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Test Call for Status Filter",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
+        call = await create_call(title="Test Call for Status Filter")
+        call_id = call["id"]
         
         # Transcribe it to change status
         await api_client.post(f"/calls/{call_id}/transcribe")
@@ -257,27 +203,15 @@ class TestCallDetails:
     """Tests for call detail endpoint"""
     
     @pytest.mark.asyncio
-    async def test_get_call_detail_existing(self, api_client: AsyncClient, sample_audio_file: Path):
+    async def test_get_call_detail_existing(self, api_client: AsyncClient, create_call):
         """
         Test Case: Get Call Details for Existing Call
         Description: Retrieve full details of a specific call
         Expected: Returns 200 OK with complete call information including transcript, analysis, etc.
         """
-        recorded_at = datetime.utcnow().isoformat()
-        
         # Create a call
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Detailed Call Test",
-                    "recorded_at": recorded_at,
-                    "contact_name": "John Doe",
-                    "company": "Test Corp",
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
+        call = await create_call(title="Detailed Call Test", contact_name="John Doe", company="Test Corp")
+        call_id = call["id"]
         
         # Get call details
         response = await api_client.get(f"/calls/{call_id}")
@@ -306,66 +240,36 @@ class TestCallDetails:
     
     @pytest.mark.asyncio
     async def test_get_call_detail_with_transcript_and_analysis(
-        self, api_client: AsyncClient, sample_audio_file: Path
+        self, api_client: AsyncClient, fully_processed_call_id: int
     ):
         """
         Test Case: Get Call Details with Transcript and Analysis
-        Description: Process a call through transcription and analysis, then retrieve details
-        Expected: Returns complete details including transcript text and analysis insights
-        """
-        recorded_at = datetime.utcnow().isoformat()
-        
-        # Create and process a call
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Processed Call",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
-        
-        # Transcribe
-        await api_client.post(f"/calls/{call_id}/transcribe")
-        
-        # Analyze
-        await api_client.post(f"/calls/{call_id}/analyze")
-        
-        # Get details
-        response = await api_client.get(f"/calls/{call_id}")
+        Description: Retrieve details of a call processed through transcription, analysis and CRM sync
+        Expected: Returns complete details including transcript text, analysis insights and CRM records
+        """
+        response = await api_client.get(f"/calls/{fully_processed_call_id}")
         assert response.status_code == 200
         data = response.json()
         assert data["transcript"] is not None
         assert data["transcript"]["text"] is not None
         assert data["analysis"] is not None
-        assert data["call"]["status"].upper() == "ANALYZED"
+        assert data["call"]["status"].upper() == "SYNCED"
+        assert len(data["crm_notes"]) > 0 or len(data["crm_tasks"]) > 0
 
 
 class TestTranscriptionWorkflow:
     """Tests for transcription endpoint"""
     
     @pytest.mark.asyncio
-    async def test_transcribe_call_success(self, api_client: AsyncClient, sample_audio_file: Path):
+    async def test_transcribe_call_success(self, api_client: AsyncClient, create_call):
         """
         Test Case: Transcribe Call Successfully
         Description: Transcribe a new call
         Expected: Returns 200 OK with transcript data, call status updated to TRANSCRIBED
         """
-        recorded_at = datetime.utcnow().isoformat()
-        
         # Create a call
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Call to Transcribe",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
+        call = await create_call(title="Call to Transcribe")
+        call_id = call["id"]
         
         # Transcribe
         response = await api_client.post(f"/calls/{call_id}/transcribe")
@@ -390,25 +294,15 @@ class TestTranscriptionWorkflow:
         assert response.status_code == 400
     
     @pytest.mark.asyncio
-    async def test_transcribe_call_already_transcribed(self, api_client: AsyncClient, sample_audio_file: Path):
+    async def test_transcribe_call_already_transcribed(self, api_client: AsyncClient, create_call):
         """
         Test Case: Transcribe Already Transcribed Call
         Description: Attempt to transcribe a call that has already been transcribed
         Expected: Should handle gracefully (may update or skip based on implementation)
         """
-        recorded_at = datetime.utcnow().isoformat()
-        
         # Create and transcribe a call
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Double Transcribe Test",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
+        call = await create_call(title="Double Transcribe Test")
+        call_id = call["id"]
         
         # First transcription
         response1 = await api_client.post(f"/calls/{call_id}/transcribe")
@@ -424,25 +318,15 @@ class TestAnalysisWorkflow:
     """Tests for analysis endpoint"""
     
     @pytest.mark.asyncio
-    async def test_analyze_call_success(self, api_client: AsyncClient, sample_audio_file: Path):
+    async def test_analyze_call_success(self, api_client: AsyncClient, create_call):
         """
         Test Case: Analyze Call Successfully
         Description: Analyze a transcribed call
         Expected: Returns 200 OK with analysis data including summary, action items, etc.
         """
-        recorded_at = datetime.utcnow().isoformat()
-        
         # Create and transcribe a call
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Call to Analyze",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
+        call = await create_call(title="Call to Analyze")
+        call_id = call["id"]
         
         await api_client.post(f"/calls/{call_id}/transcribe")
         
@@ -458,25 +342,15 @@ class TestAnalysisWorkflow:
         assert call_response.json()["call"]["status"].upper() == "ANALYZED"
     
     @pytest.mark.asyncio
-    async def test_analyze_call_without_transcription(self, api_client: AsyncClient, sample_audio_file: Path):
+    async def test_analyze_call_without_transcription(self, api_client: AsyncClient, create_call):
         """
         Test Case: Analyze Call Without Transcription
         Description: Attempt to analyze a call that hasn't been transcribed
         Expected: Returns 400 Bad Request with appropriate error message
         """
-        recorded_at = datetime.utcnow().isoformat()
-        
         # Create a call without transcribing
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Call Without Transcript",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
+        call = await create_call(title="Call Without Transcript")
+        call_id = call["id"]
         
         # Attempt to analyze
         response = await api_client.post(f"/calls/{call_id}/analyze")
@@ -497,26 +371,15 @@ class TestCRMSyncWorkflow:
     """Tests for CRM sync endpoint"""
     
     @pytest.mark.asyncio
-    async def test_sync_crm_success(self, api_client: AsyncClient, sample_audio_file: Path):
+    async def test_sync_crm_success(self, api_client: AsyncClient, create_call):
         """
         Test Case: Sync Call to CRM Successfully
         Description: Sync a fully processed call to CRM
         Expected: Returns 200 OK with sync log, call status updated to SYNCED
         """
-        recorded_at = datetime.utcnow().isoformat()
-        
         # Create, transcribe, and analyze a call
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Call to Sync",
-                    "recorded_at": recorded_at,
-                    "crm_deal_id": "DEAL-789",
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
+        call = await create_call(title="Call to Sync", crm_deal_id="DEAL-789")
+        call_id = call["id"]
         
         await api_client.post(f"/calls/{call_id}/transcribe")
         await api_client.post(f"/calls/{call_id}/analyze")
@@ -538,63 +401,34 @@ class TestCRMSyncWorkflow:
         assert len(call_detail["crm_notes"]) > 0 or len(call_detail["crm_tasks"]) > 0
     
     @pytest.mark.asyncio
-    async def test_sync_crm_without_analysis(self, api_client: AsyncClient, sample_audio_file: Path):
+    async def test_sync_crm_without_analysis(self, api_client: AsyncClient, transcribed_call_id: int):
         """
         Test Case: Sync Call to CRM Without Analysis
-        Description: Attempt to sync a call that hasn't been analyzed
+        Description: Attempt to sync a call that has been transcribed but not analyzed
         Expected: Returns 400 Bad Request with error message
         """
-        recorded_at = datetime.utcnow().isoformat()
-        
-        # Create and transcribe a call (no analysis)
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Call Without Analysis",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
-        
-        await api_client.post(f"/calls/{call_id}/transcribe")
-        
-        # Attempt to sync
-        response = await api_client.post(f"/calls/{call_id}/sync-crm")
+        # The rejected sync leaves the shared transcribed call untouched
+        response = await api_client.post(f"/calls/{transcribed_call_id}/sync-crm")
         assert response.status_code == 400
     
     @pytest.mark.asyncio
-    async def test_sync_crm_multiple_times(self, api_client: AsyncClient, sample_audio_file: Path):
+    async def test_sync_crm_multiple_times(self, api_client: AsyncClient, fully_processed_call_id: int):
         """
         Test Case: Sync Call to CRM Multiple Times
-        Description: Sync the same call to CRM multiple times
+        Description: Sync an already synced call to CRM again
         Expected: Each sync creates a new sync log entry
         """
-        recorded_at = datetime.utcnow().isoformat()
-        
-        # Create and process a call
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Multiple Sync Test",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
-        
-        await api_client.post(f"/calls/{call_id}/transcribe")
-        await api_client.post(f"/calls/{call_id}/analyze")
+        call_response = await api_client.get(f"/calls/{fully_processed_call_id}")
+        logs_before = len(call_response.json()["crm_sync_logs"])
         
-        # Sync multiple times
-        await api_client.post(f"/calls/{call_id}/sync-crm")
-        await api_client.post(f"/calls/{call_id}/sync-crm")
+        # Sync again on top of the shared call's initial sync
+        response = await api_client.post(f"/calls/{fully_processed_call_id}/sync-crm")
+        assert response.status_code == 200
         
-        # Verify multiple sync logs
-        call_response = await api_client.get(f"/calls/{call_id}")
+        # Verify a new sync log was added
+        call_response = await api_client.get(f"/calls/{fully_processed_call_id}")
         sync_logs = call_response.json()["crm_sync_logs"]
+        assert len(sync_logs) == logs_before + 1
         assert len(sync_logs) >= 2
 
 
@@ -602,25 +436,15 @@ class TestPipelineProcessing:
     """Tests for full pipeline processing endpoint"""
     
     @pytest.mark.asyncio
-    async def test_process_call_full_pipeline(self, api_client: AsyncClient, sample_audio_file: Path):
+    async def test_process_call_full_pipeline(self, api_client: AsyncClient, create_call):
         """
         Test Case: Process Call Through Full Pipeline
         Description: Use the process endpoint to run transcription, analysis, and CRM sync in sequence
         Expected: Returns 200 OK, call fully processed with status SYNCED
         """
-        recorded_at = datetime.utcnow().isoformat()
-        
         # Create a call
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Full Pipeline Test",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
+        call = await create_call(title="Full Pipeline Test")
+        call_id = call["id"]
         
         # Process full pipeline
         response = await api_client.post(f"/calls/{call_id}/process")
@@ -651,28 +475,15 @@ class TestEndToEndWorkflow:
     """Tests for complete end-to-end workflows"""
     
     @pytest.mark.asyncio
-    async def test_complete_workflow_manual_steps(self, api_client: AsyncClient, sample_audio_file: Path):
+    async def test_complete_workflow_manual_steps(self, api_client: AsyncClient, create_call):
         """
         Test Case: Complete Workflow with Manual Steps
         Description: Create a call and process it step-by-step through all stages
         Expected: Call progresses through NEW → TRANSCRIBED → ANALYZED → SYNCED
         """
-        recorded_at = datetime.utcnow().isoformat()
-        
         # Step 1: Create call
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Manual Workflow Test",
-                    "recorded_at": recorded_at,
-                    "contact_name": "Jane Doe",
-                    "company": "Test Company",
-                    "call_type": "demo",
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
+        call = await create_call(title="Manual Workflow Test", contact_name="Jane Doe", company="Test Company", call_type="demo")
+        call_id = call["id"]
         
         # Verify initial state
         call_response = await api_client.get(f"/calls/{call_id}")
@@ -697,31 +508,21 @@ class TestEndToEndWorkflow:
         assert len(call_response.json()["crm_sync_logs"]) > 0
     
     @pytest.mark.asyncio
-    async def test_multiple_calls_workflow(self, api_client: AsyncClient, sample_audio_file: Path):
+    async def test_multiple_calls_workflow(self, api_client: AsyncClient, create_call):
         """
         Test Case: Process Multiple Calls in Sequence
         Description: Create and process multiple calls to verify system handles concurrent operations
         Expected: All calls are processed independently and correctly
         """
-        recorded_at = datetime.utcnow().isoformat()
-        call_ids = []
+        # Create 3 calls concurrently
+        calls = await asyncio.gather(*(create_call(title=f"Batch Call {i+1}") for i in range(3)))
+        call_ids = [call["id"] for call in calls]
         
-        # Create 3 calls
-        for i in range(3):
-            with open(sample_audio_file, "rb") as f:
-                response = await api_client.post(
-                    "/calls",
-                    data={
-                        "title": f"Batch Call {i+1}",
-                        "recorded_at": recorded_at,
-                    },
-                    files={"audio_file": ("sample.wav", f, "audio/wav")}
-                )
-                call_ids.append(response.json()["id"])
-        
-        # Process all calls
-        for call_id in call_ids:
-            await api_client.post(f"/calls/{call_id}/process")
+        # Process all calls concurrently
+        process_responses = await asyncio.gather(*(
+            api_client.post(f"/calls/{call_id}/process") for call_id in call_ids
+        ))
+        assert all(response.status_code == 200 for response in process_responses)
         
         # Verify all are synced
         list_response = await api_client.get("/calls?status=SYNCED")
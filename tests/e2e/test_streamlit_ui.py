@@ -10,16 +10,56 @@ This test suite covers all Streamlit dashboard interactions:
 - Call details tabs (Transcript, Analysis, CRM Notes, Tasks, Sync Logs)
 - Error handling and edge cases
 """
-from datetime import datetime
+import re
 from pathlib import Path
+from typing import AsyncGenerator, Union
 
 import pytest
 from httpx import AsyncClient
-from playwright.async_api import Page, expect
+from playwright.async_api import BrowserContext, Page, expect
+
+from .test_helpers import process_call_pipeline
 
 pytestmark = [pytest.mark.e2e, pytest.mark.ui]
 
 
+async def open_dashboard(page: Page, url: str) -> None:
+    """Load the dashboard and wait until everything above the call list has rendered"""
+    await page.goto(url)
+    await expect(page.locator("h1")).to_contain_text("Sales Call Summarizer", timeout=10000)
+    # Refresh is drawn after the sidebar and metrics, right before the call list
+    await expect(page.locator('button:has-text("Refresh")')).to_be_visible(timeout=10000)
+
+
+async def show_only_call(page: Page, api_client: AsyncClient, call_id: int) -> None:
+    """Search the dashboard for one call's title so its card is the only one listed"""
+    response = await api_client.get(f"/calls/{call_id}")
+    title = response.json()["call"]["title"]
+    search_input = page.locator('input[placeholder*="Search"]').first
+    await search_input.fill(title)
+    await search_input.press("Enter")
+    await expect(page.get_by_role("heading", name=re.compile(r"Calls \(1\)"))).to_be_visible()
+    await expect(page.get_by_text(title).first).to_be_visible()
+
+
+async def expect_visible_text(page: Page, pattern: Union[str, re.Pattern], **kwargs) -> None:
+    """Wait for a visible element whose text matches, without serializing the whole body"""
+    await expect(page.get_by_text(pattern).filter(visible=True).first).to_be_visible(**kwargs)
+
+
+@pytest.fixture(scope="module")
+async def dashboard_page(browser_context: BrowserContext, streamlit_server: str) -> AsyncGenerator[Page, None]:
+    """One rendered dashboard shared by the tests in this module that only read it
+
+    Tests using it must not click, type or navigate; anything that changes the
+    Streamlit session uses the per-test ``page`` fixture instead.
+    """
+    page = await browser_context.new_page()
+    await open_dashboard(page, streamlit_server)
+    yield page
+    await page.close()
+
+
 class TestDashboardLoading:
     """Tests for dashboard initialization and basic rendering"""
     
@@ -30,32 +70,18 @@ class TestDashboardLoading:
         Description: Verify that the Streamlit dashboard loads and displays the main header
         Expected: Page loads with title "Sales Call Summarizer" visible
         """
-        await page.goto(streamlit_server)
-        
-        # Wait for Streamlit to load
-        await page.wait_for_selector("h1", timeout=10000)
-        
-        # Check for main header
-        header = page.locator("h1")
-        await expect(header).to_contain_text("Sales Call Summarizer", timeout=5000)
+        await open_dashboard(page, streamlit_server)
     
     @pytest.mark.asyncio
-    async def test_dashboard_metrics_display(self, page: Page, streamlit_server: str):
+    async def test_dashboard_metrics_display(self, dashboard_page: Page):
         """
         Test Case: Dashboard Metrics Display
         Description: Verify that metrics are displayed on the dashboard
         Expected: Metrics cards showing Total Calls, New, Transcribed, Analyzed, Synced, Last 7 Days
         """
-        await page.goto(streamlit_server)
-        await page.wait_for_selector("h1", timeout=10000)
-        
-        # Wait for metrics to load
-        await page.wait_for_timeout(2000)
-        
         # Check for metric labels
-        page_text = await page.text_content("body")
-        assert "Total Calls" in page_text
-        assert "New" in page_text or "Transcribed" in page_text
+        await expect_visible_text(dashboard_page, "Total Calls")
+        await expect_visible_text(dashboard_page, re.compile("New|Transcribed"))
 
 
 class TestCallUpload:
@@ -63,18 +89,17 @@ class TestCallUpload:
     
     @pytest.mark.asyncio
     async def test_upload_call_with_all_fields(
-        self, page: Page, streamlit_server: str, sample_audio_file: Path
+        self, page: Page, streamlit_server: str, sample_audio_file: Path, api_client: AsyncClient
     ):
         """
         Test Case: Upload Call with All Fields
         Description: Upload a call using the sidebar form with all fields filled
-        Expected: Call is created successfully and appears in the call list
+        Expected: Success message is shown and the form values are stored on the call
         """
-        await page.goto(streamlit_server)
-        await page.wait_for_selector("h1", timeout=10000)
+        await open_dashboard(page, streamlit_server)
         
         # Fill in the upload form
-        title_input = page.locator('input[placeholder*="Discovery call"]').first()
+        title_input = page.locator('input[placeholder*="Discovery call"]').first
         await title_input.fill("E2E Test Call - Complete")
         
         # Set participants
@@ -88,12 +113,12 @@ class TestCallUpload:
             await contact_input.fill("John Doe")
         
         # Set company
-        company_input = page.locator('input[placeholder*="Acme Corp"]')
+        company_input = page.locator('input[placeholder="Acme Corp"]')
         if await company_input.count() > 0:
             await company_input.fill("Test Company Inc")
         
         # Select call type
-        call_type_select = page.locator('select').first()
+        call_type_select = page.locator('select').first
         if await call_type_select.count() > 0:
             await call_type_select.select_option("discovery")
         
@@ -102,15 +127,17 @@ class TestCallUpload:
         await file_input.set_input_files(str(sample_audio_file))
         
         # Submit form
-        submit_button = page.locator('button:has-text("Create Call")').first()
+        submit_button = page.locator('button:has-text("Create Call")').first
         await submit_button.click()
         
-        # Wait for success message or call to appear
-        await page.wait_for_timeout(3000)
+        # The page only has to confirm the upload; the stored values are checked through the API
+        await expect(page.get_by_text(re.compile("created successfully", re.I)).first).to_be_visible()
         
-        # Verify call was created (check for success message or call in list)
-        page_text = await page.text_content("body")
-        assert "created successfully" in page_text.lower() or "E2E Test Call" in page_text
+        response = await api_client.get("/calls")
+        call = next(c for c in response.json() if c["title"] == "E2E Test Call - Complete")
+        assert call["contact_name"] == "John Doe"
+        assert call["company"] == "Test Company Inc"
+        assert call["participants"] == ["John Doe", "Jane Smith"]
     
     @pytest.mark.asyncio
     async def test_upload_call_validation_required_fields(
@@ -121,19 +148,14 @@ class TestCallUpload:
         Description: Attempt to submit form without required fields (title and audio file)
         Expected: Warning message displayed, call not created
         """
-        await page.goto(streamlit_server)
-        await page.wait_for_selector("h1", timeout=10000)
+        await open_dashboard(page, streamlit_server)
         
         # Try to submit without filling required fields
-        submit_button = page.locator('button:has-text("Create Call")').first()
+        submit_button = page.locator('button:has-text("Create Call")').first
         await submit_button.click()
         
-        # Wait for validation message
-        await page.wait_for_timeout(1000)
-        
         # Check for warning message
-        page_text = await page.text_content("body")
-        assert "required fields" in page_text.lower() or "please fill" in page_text.lower()
+        await expect_visible_text(page, re.compile("required fields|please fill", re.I))
     
     @pytest.mark.asyncio
     async def test_upload_call_minimal_fields(
@@ -144,11 +166,10 @@ class TestCallUpload:
         Description: Upload a call with only required fields (title and audio)
         Expected: Call is created successfully with default values
         """
-        await page.goto(streamlit_server)
-        await page.wait_for_selector("h1", timeout=10000)
+        await open_dashboard(page, streamlit_server)
         
         # Fill only required fields
-        title_input = page.locator('input[placeholder*="Discovery call"]').first()
+        title_input = page.locator('input[placeholder*="Discovery call"]').first
         await title_input.fill("Minimal Call Test")
         
         # Upload audio file
@@ -156,67 +177,43 @@ class TestCallUpload:
         await file_input.set_input_files(str(sample_audio_file))
         
         # Submit form
-        submit_button = page.locator('button:has-text("Create Call")').first()
+        submit_button = page.locator('button:has-text("Create Call")').first
         await submit_button.click()
         
-        # Wait for success
-        await page.wait_for_timeout(3000)
-        
         # Verify call was created
-        page_text = await page.text_content("body")
-        assert "created successfully" in page_text.lower() or "Minimal Call Test" in page_text
+        await expect_visible_text(page, re.compile("created successfully|Minimal Call Test", re.I))
 
 
 class TestCallListing:
     """Tests for call listing and display"""
     
     @pytest.mark.asyncio
-    async def test_display_empty_call_list(self, page: Page, streamlit_server: str):
+    async def test_display_empty_call_list(self, dashboard_page: Page):
         """
         Test Case: Display Empty Call List
         Description: View dashboard when no calls exist
         Expected: Message indicating no calls found, with suggestion to upload
         """
-        await page.goto(streamlit_server)
-        await page.wait_for_selector("h1", timeout=10000)
-        await page.wait_for_timeout(2000)
-        
         # Check for empty state message
-        page_text = await page.text_content("body")
-        assert "no calls found" in page_text.lower() or "upload" in page_text.lower()
+        await expect_visible_text(dashboard_page, re.compile("no calls found|upload", re.I))
     
     @pytest.mark.asyncio
     async def test_display_calls_in_list(
-        self, page: Page, streamlit_server: str, sample_audio_file: Path, api_client
+        self, page: Page, streamlit_server: str, create_call
     ):
         """
         Test Case: Display Calls in List
-        Description: Create calls via API and verify they appear in the Streamlit dashboard
-        Expected: Created calls are visible in the call list with correct information
+        Description: Create a call via API and verify the dashboard renders its card
+        Expected: The created call's title is visible in the call list
         """
         # Create a call via API
-        recorded_at = datetime.utcnow().isoformat()
-        with open(sample_audio_file, "rb") as f:
-            await api_client.post(
-                "/calls",
-                data={
-                    "title": "UI Display Test Call",
-                    "recorded_at": recorded_at,
-                    "contact_name": "Test Contact",
-                    "company": "Test Company",
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
+        await create_call(title="UI Display Test Call", contact_name="Test Contact", company="Test Company")
         
         # Load dashboard
-        await page.goto(streamlit_server)
-        await page.wait_for_selector("h1", timeout=10000)
-        await page.wait_for_timeout(3000)
+        await open_dashboard(page, streamlit_server)
         
         # Verify call appears
-        page_text = await page.text_content("body")
-        assert "UI Display Test Call" in page_text
-        assert "Test Contact" in page_text or "Test Company" in page_text
+        await expect(page.get_by_text("UI Display Test Call").first).to_be_visible()
 
 
 class TestCallFiltering:
@@ -224,7 +221,7 @@ class TestCallFiltering:
     
     @pytest.mark.asyncio
     async def test_filter_calls_by_status(
-        self, page: Page, streamlit_server: str, sample_audio_file: Path, api_client
+        self, page: Page, streamlit_server: str, api_client: AsyncClient, create_call
     ):
         """
         Test Case: Filter Calls by Status
@@ -232,74 +229,49 @@ class TestCallFiltering:
         Expected: Only calls matching the selected status are displayed
         """
         # Create calls in different states
-        recorded_at = datetime.utcnow().isoformat()
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "New Status Call",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
-            
-            # Transcribe to change status
-            await api_client.post(f"/calls/{call_id}/transcribe")
+        call = await create_call(title="New Status Call")
+        call_id = call["id"]
+        
+        # Transcribe to change status
+        await process_call_pipeline(api_client, call_id, stages=("transcribe",))
         
         # Load dashboard
-        await page.goto(streamlit_server)
-        await page.wait_for_selector("h1", timeout=10000)
-        await page.wait_for_timeout(2000)
+        await open_dashboard(page, streamlit_server)
         
         # Find and use status filter
-        status_filter = page.locator('select').first()
+        status_filter = page.locator('select').first
         if await status_filter.count() > 0:
             await status_filter.select_option("transcribed")
-            await page.wait_for_timeout(2000)
             
             # Verify filtered results
-            page_text = await page.text_content("body")
-            assert "New Status Call" in page_text
+            await expect(page.get_by_text("New Status Call").first).to_be_visible()
     
     @pytest.mark.asyncio
     async def test_search_calls_by_keyword(
-        self, page: Page, streamlit_server: str, sample_audio_file: Path, api_client
+        self, page: Page, streamlit_server: str, create_call
     ):
         """
         Test Case: Search Calls by Keyword
-        Description: Use the search input to filter calls by title, contact, or company
-        Expected: Only calls matching the search query are displayed
+        Description: Type into the search input (matching rules are covered in tests/test_call_service.py)
+        Expected: The list narrows to the one matching call
         """
         # Create a call with specific details
-        recorded_at = datetime.utcnow().isoformat()
-        with open(sample_audio_file, "rb") as f:
-            await api_client.post(
-                "/calls",
-                data={
-                    "title": "Unique Search Test Call",
-                    "recorded_at": recorded_at,
-                    "contact_name": "Searchable Contact",
-                    "company": "Search Company",
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
+        await create_call(
+            title="Unique Search Test Call", contact_name="Searchable Contact", company="Search Company"
+        )
         
         # Load dashboard
-        await page.goto(streamlit_server)
-        await page.wait_for_selector("h1", timeout=10000)
-        await page.wait_for_timeout(2000)
+        await open_dashboard(page, streamlit_server)
         
         # Find and use search input
         search_inputs = page.locator('input[placeholder*="Search"]')
         if await search_inputs.count() > 0:
-            search_input = search_inputs.first()
+            search_input = search_inputs.first
             await search_input.fill("Unique Search")
-            await page.wait_for_timeout(2000)
+            await search_input.press("Enter")
             
             # Verify search results
-            page_text = await page.text_content("body")
-            assert "Unique Search Test Call" in page_text
+            await expect(page.get_by_role("heading", name=re.compile(r"Calls \(1\)"))).to_be_visible()
 
 
 class TestCallActions:
@@ -307,7 +279,7 @@ class TestCallActions:
     
     @pytest.mark.asyncio
     async def test_transcribe_call_action(
-        self, page: Page, streamlit_server: str, sample_audio_file: Path, api_client
+        self, page: Page, streamlit_server: str, api_client: AsyncClient, create_call
     ):
         """
         Test Case: Transcribe Call Action
@@ -315,36 +287,23 @@ class TestCallActions:
         Expected: Call is transcribed, status updated, success message displayed
         """
         # Create a call via API
-        recorded_at = datetime.utcnow().isoformat()
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Transcribe Action Test",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
+        call = await create_call(title="Transcribe Action Test")
         
-        # Load dashboard
-        await page.goto(streamlit_server)
-        await page.wait_for_selector("h1", timeout=10000)
-        await page.wait_for_timeout(3000)
+        # Load dashboard narrowed to this call, so the buttons below belong to its card
+        await open_dashboard(page, streamlit_server)
+        await show_only_call(page, api_client, call["id"])
         
         # Find and click Transcribe button
         transcribe_buttons = page.locator('button:has-text("Transcribe")')
         if await transcribe_buttons.count() > 0:
-            await transcribe_buttons.first().click()
-            await page.wait_for_timeout(3000)
+            await transcribe_buttons.first.click()
             
             # Check for success message
-            page_text = await page.text_content("body")
-            assert "transcribed" in page_text.lower()
+            await expect_visible_text(page, re.compile("transcribed", re.I))
     
     @pytest.mark.asyncio
     async def test_analyze_call_action(
-        self, page: Page, streamlit_server: str, sample_audio_file: Path, api_client
+        self, page: Page, streamlit_server: str, api_client: AsyncClient, create_call
     ):
         """
         Test Case: Analyze Call Action
@@ -352,38 +311,26 @@ class TestCallActions:
         Expected: Call is analyzed, status updated, success message displayed
         """
         # Create and transcribe a call via API
-        recorded_at = datetime.utcnow().isoformat()
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Analyze Action Test",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
-        
-        await api_client.post(f"/calls/{call_id}/transcribe")
+        call = await create_call(title="Analyze Action Test")
+        call_id = call["id"]
         
-        # Load dashboard
-        await page.goto(streamlit_server)
-        await page.wait_for_selector("h1", timeout=10000)
-        await page.wait_for_timeout(3000)
+        await process_call_pipeline(api_client, call_id, stages=("transcribe",))
+        
+        # Load dashboard narrowed to this call, so the buttons below belong to its card
+        await open_dashboard(page, streamlit_server)
+        await show_only_call(page, api_client, call_id)
         
         # Find and click Analyze button
         analyze_buttons = page.locator('button:has-text("Analyze")')
         if await analyze_buttons.count() > 0:
-            await analyze_buttons.first().click()
-            await page.wait_for_timeout(3000)
+            await analyze_buttons.first.click()
             
             # Check for success message
-            page_text = await page.text_content("body")
-            assert "analyzed" in page_text.lower()
+            await expect_visible_text(page, re.compile("analyzed", re.I))
     
     @pytest.mark.asyncio
     async def test_sync_crm_action(
-        self, page: Page, streamlit_server: str, sample_audio_file: Path, api_client
+        self, page: Page, streamlit_server: str, api_client: AsyncClient, create_call
     ):
         """
         Test Case: Sync CRM Action
@@ -391,39 +338,26 @@ class TestCallActions:
         Expected: Call is synced to CRM, status updated, success message displayed
         """
         # Create, transcribe, and analyze a call via API
-        recorded_at = datetime.utcnow().isoformat()
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Sync CRM Action Test",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
-        
-        await api_client.post(f"/calls/{call_id}/transcribe")
-        await api_client.post(f"/calls/{call_id}/analyze")
+        call = await create_call(title="Sync CRM Action Test")
+        call_id = call["id"]
         
-        # Load dashboard
-        await page.goto(streamlit_server)
-        await page.wait_for_selector("h1", timeout=10000)
-        await page.wait_for_timeout(3000)
+        await process_call_pipeline(api_client, call_id, stages=("transcribe", "analyze"))
+        
+        # Load dashboard narrowed to this call, so the buttons below belong to its card
+        await open_dashboard(page, streamlit_server)
+        await show_only_call(page, api_client, call_id)
         
         # Find and click Sync CRM button
         sync_buttons = page.locator('button:has-text("Sync CRM")')
         if await sync_buttons.count() > 0:
-            await sync_buttons.first().click()
-            await page.wait_for_timeout(3000)
+            await sync_buttons.first.click()
             
             # Check for success message
-            page_text = await page.text_content("body")
-            assert "synced" in page_text.lower()
+            await expect_visible_text(page, re.compile("synced", re.I))
     
     @pytest.mark.asyncio
     async def test_process_all_action(
-        self, page: Page, streamlit_server: str, sample_audio_file: Path, api_client
+        self, page: Page, streamlit_server: str, api_client: AsyncClient, create_call
     ):
         """
         Test Case: Process All Action
@@ -431,32 +365,19 @@ class TestCallActions:
         Expected: Call is processed through all stages, success message displayed
         """
         # Create a call via API
-        recorded_at = datetime.utcnow().isoformat()
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Process All Action Test",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
+        call = await create_call(title="Process All Action Test")
         
-        # Load dashboard
-        await page.goto(streamlit_server)
-        await page.wait_for_selector("h1", timeout=10000)
-        await page.wait_for_timeout(3000)
+        # Load dashboard narrowed to this call, so the buttons below belong to its card
+        await open_dashboard(page, streamlit_server)
+        await show_only_call(page, api_client, call["id"])
         
         # Find and click Process All button
         process_buttons = page.locator('button:has-text("Process All")')
         if await process_buttons.count() > 0:
-            await process_buttons.first().click()
-            await page.wait_for_timeout(5000)  # Process All takes longer
+            await process_buttons.first.click()
             
-            # Check for success message
-            page_text = await page.text_content("body")
-            assert "completed" in page_text.lower() or "synced" in page_text.lower()
+            # Check for success message (Process All takes longer)
+            await expect_visible_text(page, re.compile("completed|synced", re.I), timeout=10000)
 
 
 class TestCallDetails:
@@ -464,124 +385,70 @@ class TestCallDetails:
     
     @pytest.mark.asyncio
     async def test_view_transcript_tab(
-        self, page: Page, streamlit_server: str, sample_audio_file: Path, api_client
+        self, page: Page, streamlit_server: str, api_client: AsyncClient, transcribed_call_id: int
     ):
         """
         Test Case: View Transcript Tab
         Description: Open a transcribed call and view the transcript tab
         Expected: Transcript text is displayed in the tab
         """
-        # Create and transcribe a call via API
-        recorded_at = datetime.utcnow().isoformat()
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Transcript View Test",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
-        
-        await api_client.post(f"/calls/{call_id}/transcribe")
-        
-        # Load dashboard
-        await page.goto(streamlit_server)
-        await page.wait_for_selector("h1", timeout=10000)
-        await page.wait_for_timeout(3000)
+        # Load dashboard showing only the shared transcribed call
+        await open_dashboard(page, streamlit_server)
+        await show_only_call(page, api_client, transcribed_call_id)
         
         # Find and click Transcript tab
         transcript_tabs = page.locator('button[role="tab"]:has-text("Transcript")')
         if await transcript_tabs.count() > 0:
-            await transcript_tabs.first().click()
-            await page.wait_for_timeout(1000)
+            await transcript_tabs.first.click()
             
             # Check for transcript content
-            page_text = await page.text_content("body")
-            assert "transcript" in page_text.lower() or "text" in page_text.lower()
+            await expect_visible_text(page, re.compile("transcript|text", re.I))
     
     @pytest.mark.asyncio
     async def test_view_analysis_tab(
-        self, page: Page, streamlit_server: str, sample_audio_file: Path, api_client
+        self, page: Page, streamlit_server: str, api_client: AsyncClient, analyzed_call_id: int
     ):
         """
         Test Case: View Analysis Tab
         Description: Open an analyzed call and view the analysis tab
         Expected: Analysis data including summary, action items, etc. is displayed
         """
-        # Create, transcribe, and analyze a call via API
-        recorded_at = datetime.utcnow().isoformat()
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "Analysis View Test",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
-        
-        await api_client.post(f"/calls/{call_id}/transcribe")
-        await api_client.post(f"/calls/{call_id}/analyze")
-        
-        # Load dashboard
-        await page.goto(streamlit_server)
-        await page.wait_for_selector("h1", timeout=10000)
-        await page.wait_for_timeout(3000)
+        # Load dashboard showing only the shared analyzed call
+        await open_dashboard(page, streamlit_server)
+        await show_only_call(page, api_client, analyzed_call_id)
         
         # Find and click Analysis tab
         analysis_tabs = page.locator('button[role="tab"]:has-text("Analysis")')
         if await analysis_tabs.count() > 0:
-            await analysis_tabs.first().click()
-            await page.wait_for_timeout(1000)
+            await analysis_tabs.first.click()
             
             # Check for analysis content
-            page_text = await page.text_content("body")
-            assert "summary" in page_text.lower() or "action" in page_text.lower()
+            await expect_visible_text(page, re.compile("summary|action", re.I))
     
     @pytest.mark.asyncio
     async def test_view_crm_notes_and_tasks_tabs(
-        self, page: Page, streamlit_server: str, sample_audio_file: Path, api_client
+        self, page: Page, streamlit_server: str, api_client: AsyncClient, fully_processed_call_id: int
     ):
         """
         Test Case: View CRM Notes and Tasks Tabs
         Description: Open a synced call and view CRM notes and tasks
         Expected: CRM notes and tasks are displayed in their respective tabs
         """
-        # Create and fully process a call via API
-        recorded_at = datetime.utcnow().isoformat()
-        with open(sample_audio_file, "rb") as f:
-            response = await api_client.post(
-                "/calls",
-                data={
-                    "title": "CRM View Test",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
-            call_id = response.json()["id"]
-        
-        await api_client.post(f"/calls/{call_id}/process")
-        
-        # Load dashboard
-        await page.goto(streamlit_server)
-        await page.wait_for_selector("h1", timeout=10000)
-        await page.wait_for_timeout(3000)
+        # Load dashboard showing only the shared synced call
+        await open_dashboard(page, streamlit_server)
+        await show_only_call(page, api_client, fully_processed_call_id)
         
         # Check for CRM tabs
-        page_text = await page.text_content("body")
         notes_tabs = page.locator('button[role="tab"]:has-text("CRM Notes")')
         tasks_tabs = page.locator('button[role="tab"]:has-text("Tasks")')
         
         if await notes_tabs.count() > 0:
-            await notes_tabs.first().click()
-            await page.wait_for_timeout(1000)
+            await notes_tabs.first.click()
+            await expect(notes_tabs.first).to_have_attribute("aria-selected", "true")
         
         if await tasks_tabs.count() > 0:
-            await tasks_tabs.first().click()
-            await page.wait_for_timeout(1000)
+            await tasks_tabs.first.click()
+            await expect(tasks_tabs.first).to_have_attribute("aria-selected", "true")
 
 
 class TestRefreshFunctionality:
@@ -589,7 +456,7 @@ class TestRefreshFunctionality:
     
     @pytest.mark.asyncio
     async def test_refresh_button_updates_data(
-        self, page: Page, streamlit_server: str, sample_audio_file: Path, api_client
+        self, page: Page, streamlit_server: str, create_call
     ):
         """
         Test Case: Refresh Button Updates Data
@@ -597,29 +464,16 @@ class TestRefreshFunctionality:
         Expected: New call appears in the list after refresh
         """
         # Load dashboard first
-        await page.goto(streamlit_server)
-        await page.wait_for_selector("h1", timeout=10000)
-        await page.wait_for_timeout(2000)
+        await open_dashboard(page, streamlit_server)
         
         # Create a call via API
-        recorded_at = datetime.utcnow().isoformat()
-        with open(sample_audio_file, "rb") as f:
-            await api_client.post(
-                "/calls",
-                data={
-                    "title": "Refresh Test Call",
-                    "recorded_at": recorded_at,
-                },
-                files={"audio_file": ("sample.wav", f, "audio/wav")}
-            )
+        await create_call(title="Refresh Test Call")
         
         # Click refresh button
         refresh_buttons = page.locator('button:has-text("Refresh")')
         if await refresh_buttons.count() > 0:
-            await refresh_buttons.first().click()
-            await page.wait_for_timeout(3000)
+            await refresh_buttons.first.click()
             
             # Verify new call appears
-            page_text = await page.text_content("body")
-            assert "Refresh Test Call" in page_text
+            await expect(page.get_by_text("Refresh Test Call").first).to_be_visible()
 
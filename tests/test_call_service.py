@@ -17,3 +17,56 @@ def test_create_call(session):
     assert call.id is not None
     assert call.status == CallStatus.NEW
     assert call.audio_path == "/tmp/audio.wav"
+
+
+def test_list_calls_paginates(session):
+    service = CallService(session)
+    for i in range(5):
+        service.create_call(
+            CallCreate(title=f"Call {i}", recorded_at=datetime(2024, 1, i + 1)),
+            audio_path=f"/tmp/audio{i}.wav",
+        )
+
+    page = service.list_calls(limit=2, offset=1)
+    assert [call.title for call in page] == ["Call 3", "Call 2"]
+    assert len(service.list_calls()) == 5
+
+
+def test_list_calls_orders_ties_by_newest(session):
+    service = CallService(session)
+    for i in range(3):
+        service.create_call(
+            CallCreate(title=f"Call {i}", recorded_at=datetime(2024, 1, 1)),
+            audio_path=f"/tmp/audio{i}.wav",
+        )
+
+    assert [call.title for call in service.list_calls()] == ["Call 2", "Call 1", "Call 0"]
+
+
+def _create_searchable_calls(service):
+    calls = [
+        CallCreate(title="Unique Search Test Call", recorded_at=datetime(2024, 1, 3)),
+        CallCreate(title="Pricing call", recorded_at=datetime(2024, 1, 2), contact_name="Searchable Contact"),
+        CallCreate(title="Kickoff", recorded_at=datetime(2024, 1, 1), company="Acme Corp"),
+    ]
+    return [service.create_call(call, audio_path=f"/tmp/audio{i}.wav") for i, call in enumerate(calls)]
+
+
+def test_list_call_rows_searches_title_contact_and_company(session):
+    service = CallService(session)
+    _create_searchable_calls(service)
+
+    assert [row.title for row in service.list_call_rows(search_query="unique search")] == ["Unique Search Test Call"]
+    assert [row.title for row in service.list_call_rows(search_query="SEARCHABLE")] == ["Pricing call"]
+    assert [row.title for row in service.list_call_rows(search_query="acme")] == ["Kickoff"]
+    assert service.count_calls(search_query="search") == 2
+
+
+def test_list_call_rows_filters_by_status(session):
+    service = CallService(session)
+    calls = _create_searchable_calls(service)
+    service.update_status(calls[1], CallStatus.TRANSCRIBED)
+
+    rows = service.list_call_rows(status=CallStatus.TRANSCRIBED)
+    assert [row.id for row in rows] == [calls[1].id]
+    assert service.count_calls(status=CallStatus.NEW) == 2
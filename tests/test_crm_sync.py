@@ -1,8 +1,6 @@
 from datetime import datetime
 
-from app.asr.stub_client import StubTranscriptionClient
 from app.crm.fake_client import FakeCRMClient
-from app.llm.stub_client import StubLLMClient
 from app.schemas import CallCreate
 from app.services.analysis_service import AnalysisService
 from app.services.call_service import CallService
@@ -10,18 +8,44 @@ from app.services.crm_service import CRMService
 from app.services.transcription_service import TranscriptionService
 
 
-def test_crm_sync(session, tmp_path):
-    audio_path = tmp_path / "audio.wav"
-    audio_path.write_text("fake audio data")
-    call_service = CallService(session)
-    call = call_service.create_call(
-        CallCreate(title="Call", recorded_at=datetime.utcnow()), audio_path=str(audio_path)
-    )
+def test_crm_sync(session, transcribed_call, llm_client):
+    call, _ = transcribed_call
+    AnalysisService(session, llm_client).analyze_call(call.id)
+
+    crm_service = CRMService(session, FakeCRMClient(session))
+    logs = crm_service.sync_calls([call.id])
+
+    assert [log.status.name for log in logs] == ["SUCCESS"]
+
 
-    TranscriptionService(session, StubTranscriptionClient()).transcribe_call(call.id)
-    AnalysisService(session, StubLLMClient()).analyze_call(call.id)
+def test_crm_sync_batches_several_calls(session, transcription_client, llm_client):
+    calls = [
+        CallService(session).create_call(
+            CallCreate(title=f"Call {i}", recorded_at=datetime.utcnow()), audio_path="/tmp/audio.wav"
+        )
+        for i in range(2)
+    ]
+    for call in calls:
+        TranscriptionService(session, transcription_client).transcribe_call(call.id)
+        AnalysisService(session, llm_client).analyze_call(call.id)
 
     crm_service = CRMService(session, FakeCRMClient(session))
-    log = crm_service.sync_call(call.id)
+    logs = crm_service.sync_calls([call.id for call in calls])
+
+    assert [log.call_id for log in logs] == [call.id for call in calls]
+    assert all(log.status.name == "SUCCESS" and log.payload["task_ids"] for log in logs)
+    # A second sync adds a new note but no duplicate tasks
+    assert all(not log.payload["task_ids"] for log in crm_service.sync_calls([calls[0].id]))
+
+
+async def test_crm_sync_async(session, transcription_client, llm_client):
+    call = CallService(session).create_call(
+        CallCreate(title="Call", recorded_at=datetime.utcnow()), audio_path="/tmp/audio.wav"
+    )
+
+    # Each stage needs the previous one's output, so they are awaited in order
+    await TranscriptionService(session, transcription_client).transcribe_call_async(call.id)
+    await AnalysisService(session, llm_client).analyze_call_async(call.id)
+    log = await CRMService(session, FakeCRMClient(session)).sync_call_async(call.id)
 
     assert log.status.name == "SUCCESS"